@@ -1,62 +1,237 @@
-from flask import Flask, request, jsonify
+import hashlib
+import json
+import os
+import time
+from flask import Flask, Response, g, request, jsonify
 from datetime import datetime
-import pandas as pd
 from github_service import GitHubService
+from bulk_io import UploadError, iter_csv_export, iter_csv_rows, iter_upload_rows, read_projects
+from change_log import ChangeLog
+from commit_queue import ProjectOperation
+from metrics import PHASE_LATENCY, REQUEST_LATENCY, CounterFunction, Gauge, registry, timed
+from project_query import ProjectIndexCache, ProjectQuery
+from project_records import PROJECT_FIELDS
+from project_stats import ProjectStats
+from project_store import create_project_store, database_uri
 
 app = Flask(__name__)
+# SQLAlchemy는 SQL 저장소나 마이그레이션 CLI(flask db ...)에서만 불러와 워커 시작을 가볍게 유지
+RUN_FROM_CLI = os.getenv('FLASK_RUN_FROM_CLI') == 'true'
+if os.getenv('PROJECT_STORE', 'github').lower() == 'sql' or RUN_FROM_CLI:
+    from models import db
+    app.config['SQLALCHEMY_DATABASE_URI'] = database_uri()
+    db.init_app(app)
+    if RUN_FROM_CLI:
+        from flask_migrate import Migrate
+        migrate = Migrate(app, db)
 github_service = GitHubService()
 CSV_PATH = 'assets/project_list.csv'
+COMMIT_WAIT_TIMEOUT = float(os.getenv('COMMIT_WAIT_TIMEOUT', '30'))
+STREAM_THRESHOLD = int(os.getenv('STREAM_THRESHOLD', '500'))
+IMPORT_BATCH_SIZE = int(os.getenv('IMPORT_BATCH_SIZE', '500'))
 
-def load_projects():
-    """GitHub에서 프로젝트 목록을 가져옴"""
-    content, sha = github_service.get_file_content(CSV_PATH)
-    if content:
-        df = pd.read_csv(pd.StringIO(content))
-        return df, sha
-    return pd.DataFrame(), None
+project_store = create_project_store(github_service, CSV_PATH)
+project_index = ProjectIndexCache(project_store)
+change_log = ChangeLog()
+project_store.add_observer(change_log)
+project_stats = ProjectStats()
+project_store.add_observer(project_stats)
 
-def save_projects(df, message="Update projects"):
-    """GitHub에 프로젝트 목록을 저장"""
-    content = df.to_csv(index=False)
-    _, sha = github_service.get_file_content(CSV_PATH)
-    return github_service.update_file(CSV_PATH, content, message, sha)
+registry.register(Gauge(
+    'github_rate_limit_remaining', 'Last seen X-RateLimit-Remaining',
+    lambda: github_service.rate_limit_remaining
+))
+
+def _cache_stat(*keys):
+    # SQL 저장소에는 읽기 캐시가 없으므로 값 없이 출력된다
+    cache = project_store.stats().get('cache')
+    return sum(cache[key] for key in keys) if cache else None
+
+registry.register(CounterFunction(
+    'project_cache_hits_total', 'Project cache hits including 304 revalidations',
+    lambda: _cache_stat('hits', 'revalidations')
+))
+registry.register(CounterFunction(
+    'project_cache_misses_total', 'Project cache misses (re-parsed)',
+    lambda: _cache_stat('misses')
+))
+
+@app.before_request
+def start_timer():
+    g.request_started = time.perf_counter()
+
+@app.after_request
+def record_latency(response):
+    started = g.pop('request_started', None)
+    if started is not None:
+        route = request.url_rule.rule if request.url_rule else 'unmatched'
+        REQUEST_LATENCY.observe(
+            time.perf_counter() - started,
+            method=request.method, route=route, status=response.status_code
+        )
+    return response
+
+@app.route('/metrics', methods=['GET'])
+def get_metrics():
+    return Response(registry.render(), mimetype='text/plain; version=0.0.4')
+
+def submit_operation(operation, **extra):
+    """변경을 커밋 큐에 넣고, wait=false가 아니면 커밋 완료까지 대기"""
+    pending = project_store.submit(operation)
+    if request.args.get('wait', 'true').lower() == 'false':
+        return jsonify({'success': True, 'pending': True, 'token': pending.token, **extra}), 202
+    if not pending.wait(COMMIT_WAIT_TIMEOUT):
+        return jsonify({'success': True, 'pending': True, 'token': pending.token, **extra}), 202
+    if pending.status == 'committed':
+        return jsonify({'success': True, 'token': pending.token, **extra})
+    if pending.error == 'not_found':
+        return jsonify({'success': False, 'error': pending.error, **extra}), 404
+    if pending.error == 'duplicate':
+        return jsonify({'success': False, 'error': pending.error, **extra}), 409
+    return jsonify({'success': False, 'error': pending.error, **extra}), 500
+
+def stream_json_list(items):
+    """JSON 배열을 항목 단위로 나눠 스트리밍
+
+    직렬화 시간은 전송을 기다린 시간을 빼고 합산해 스트림이 끝날 때 기록한다.
+    """
+    elapsed = 0.0
+    try:
+        yield '['
+        for i, item in enumerate(items):
+            started = time.perf_counter()
+            chunk = (',' if i else '') + json.dumps(item, ensure_ascii=False)
+            elapsed += time.perf_counter() - started
+            yield chunk
+        yield ']'
+    finally:
+        PHASE_LATENCY.observe(elapsed, phase='serialize')
 
 @app.route('/api/projects', methods=['GET'])
 def get_projects():
-    df, _ = load_projects()
-    return jsonify(df.to_dict('records'))
+    try:
+        query = ProjectQuery(request.args)
+    except ValueError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+
+    # 커서를 데이터보다 먼저 읽어야 ETag가 실제 내용보다 새것이 되지 않음
+    project_store.snapshot()
+    etag = hashlib.sha1(
+        f"{change_log.cursor()}|{sorted(request.args.items(multi=True))}".encode()
+    ).hexdigest()
+    if etag in request.if_none_match:
+        return Response(status=304, headers={'ETag': f'"{etag}"'})
+
+    projects, next_cursor = project_index.get().search(query)
+    if len(projects) > STREAM_THRESHOLD:
+        response = Response(stream_json_list(projects), mimetype='application/json')
+    else:
+        with timed('serialize'):
+            response = jsonify(projects)
+    if next_cursor:
+        response.headers['X-Next-Cursor'] = next_cursor
+    response.set_etag(etag)
+    return response
+
+@app.route('/api/projects/changes', methods=['GET'])
+def get_project_changes():
+    project_store.snapshot()
+    since = request.args.get('since')
+    changes = change_log.changes_since(since) if since else None
+    if changes is None:
+        # 커서가 없거나 너무 오래되면 전체 스냅샷으로 응답
+        cursor = change_log.cursor()
+        _, projects = project_store.snapshot()
+        return jsonify({'full': True, 'cursor': cursor, 'projects': projects})
+
+    upserts, deletes, cursor = changes
+    return jsonify({'full': False, 'cursor': cursor, 'upserts': upserts, 'deletes': deletes})
+
+@app.route('/api/cache/stats', methods=['GET'])
+def get_cache_stats():
+    return jsonify(project_store.stats())
+
+@app.route('/api/github/stats', methods=['GET'])
+def get_github_stats():
+    return jsonify(github_service.stats())
+
+@app.route('/api/commits/<token>', methods=['GET'])
+def get_commit_status(token):
+    pending = project_store.get_write(token)
+    if pending is None:
+        return jsonify({'success': False}), 404
+    return jsonify(pending.to_dict())
 
 @app.route('/api/projects', methods=['POST'])
 def add_project():
     project = request.json
-    df, _ = load_projects()
-    
-    df = pd.concat([df, pd.DataFrame([project])], ignore_index=True)
-    if save_projects(df, f"Add project: {project['name']}"):
-        return jsonify({'success': True})
-    return jsonify({'success': False}), 500
+    return submit_operation(ProjectOperation(
+        'add', project.get('id'), project, f"Add project: {project['name']}"
+    ))
+
+@app.route('/api/projects/stats', methods=['GET'])
+def get_project_stats():
+    project_store.snapshot()
+    try:
+        return jsonify(project_stats.summary(request.args.get('bucket', 'month')))
+    except ValueError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+
+@app.route('/api/projects/import', methods=['POST'])
+def import_projects():
+    upload = request.files.get('file')
+    if upload is not None:
+        rows = iter_upload_rows(upload.filename or '', upload.stream)
+    else:
+        rows = iter_csv_rows(request.stream)
+
+    try:
+        projects, errors = read_projects(rows, project_store.existing_ids, IMPORT_BATCH_SIZE)
+    except UploadError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+
+    skip_invalid = request.args.get('skip_invalid', 'false').lower() == 'true'
+    if errors and not skip_invalid:
+        return jsonify({'success': False, 'imported': 0, 'errors': errors}), 400
+    if not projects or request.args.get('dry_run', 'false').lower() == 'true':
+        return jsonify({'success': True, 'imported': 0, 'valid': len(projects), 'errors': errors})
+
+    return submit_operation(
+        ProjectOperation('import', projects=projects, message=f"Import {len(projects)} projects"),
+        imported=len(projects), errors=errors
+    )
+
+@app.route('/api/projects/export', methods=['GET'])
+def export_projects():
+    try:
+        query = ProjectQuery(request.args)
+    except ValueError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+
+    projects, _ = project_index.get().search(query)
+    fields = query.fields or PROJECT_FIELDS
+    return Response(
+        iter_csv_export(projects, fields),
+        mimetype='text/csv',
+        headers={'Content-Disposition': 'attachment; filename=project_list.csv'}
+    )
 
 @app.route('/api/projects/<project_id>', methods=['PUT'])
 def update_project(project_id):
     project = request.json
-    df, _ = load_projects()
-    
-    if project_id in df['id'].values:
-        idx = df[df['id'] == project_id].index[0]
-        df.loc[idx] = project
-        if save_projects(df, f"Update project: {project['name']}"):
-            return jsonify({'success': True})
-    return jsonify({'success': False}), 404
+    if project_store.get_project(project_id) is None:
+        return jsonify({'success': False}), 404
+    return submit_operation(ProjectOperation(
+        'update', project_id, project, f"Update project: {project.get('name', project_id)}"
+    ))
 
 @app.route('/api/projects/<project_id>', methods=['DELETE'])
 def delete_project(project_id):
-    df, _ = load_projects()
-    
-    if project_id in df['id'].values:
-        df = df[df['id'] != project_id]
-        if save_projects(df, f"Delete project: {project_id}"):
-            return jsonify({'success': True})
-    return jsonify({'success': False}), 404
+    if project_store.get_project(project_id) is None:
+        return jsonify({'success': False}), 404
+    return submit_operation(ProjectOperation(
+        'delete', project_id, message=f"Delete project: {project_id}"
+    ))
 
 if __name__ == '__main__':
     app.run(debug=True)
\ No newline at end of file
@@ -0,0 +1,145 @@
+"""DataFrame 경로와 ProjectTable 경로의 요청당 처리 시간 및 워커 시작 시간 비교
+
+    cd flask_server
+    python benchmarks/bench_records.py --rows 1000 5000 --repeat 20
+
+cold는 예전 핸들러처럼 요청마다 파싱 -> 변경 -> 직렬화하는 비용이고,
+cached는 SHA별로 한 번 파싱한 ProjectTable을 재사용하는 현재 경로의 비용이다
+(직렬화는 묶인 커밋마다 한 번이므로 commit 행으로 따로 잰다).
+GitHub 왕복은 포함하지 않는다.
+"""
+import argparse
+import io
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from project_records import PROJECT_FIELDS, ProjectTable
+
+
+def make_csv(rows):
+    buffer = io.StringIO()
+    buffer.write(','.join(PROJECT_FIELDS) + '\n')
+    for i in range(rows):
+        buffer.write(
+            f"p{i},프로젝트 {i},인사,채용,설명 {i},상세 {i},접수 → 검토 → 결재,"
+            f"2025-01-{i % 28 + 1:02d},2025-02-{i % 28 + 1:02d},진행중,담당{i % 7},관리{i % 3},"
+            f"2025-01-01T00:00:00,2025-01-01T00:00:00,\n"
+        )
+    return buffer.getvalue()
+
+def new_project(i):
+    return {field: f'{field}-{i}' for field in PROJECT_FIELDS}
+
+
+def dataframe_ops(pd):
+    def parse(content):
+        return pd.read_csv(io.StringIO(content), dtype=str, keep_default_na=False)
+
+    def get(content):
+        return parse(content).to_dict('records')
+
+    def add(content):
+        df = parse(content)
+        df = pd.concat([df, pd.DataFrame([new_project(0)])], ignore_index=True)
+        return df.to_csv(index=False)
+
+    def update(content):
+        df = parse(content)
+        idx = df[df['id'] == 'p1'].index[0]
+        df.loc[idx] = new_project(1)
+        return df.to_csv(index=False)
+
+    return {'get': get, 'add': add, 'update': update}
+
+def table_ops():
+    def get(content):
+        return [record.to_dict() for record in ProjectTable.parse(content).records()]
+
+    def add(content):
+        table = ProjectTable.parse(content)
+        table.add(new_project(0))
+        return table.to_csv()
+
+    def update(content):
+        table = ProjectTable.parse(content)
+        table.update('p1', new_project(1))
+        return table.to_csv()
+
+    return {'get': get, 'add': add, 'update': update}
+
+def cached_table_ops(table):
+    def get(content):
+        return [record.to_dict() for record in table.records()]
+
+    def add(content):
+        table.copy().add(new_project(0))
+
+    def update(content):
+        table.copy().update('p1', new_project(1))
+
+    def commit(content):
+        return table.to_csv()
+
+    return {'get': get, 'add': add, 'update': update, 'commit': commit}
+
+
+def measure(func, content, repeat):
+    func(content)
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(content)
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+def _ms(value):
+    return '-' if value is None else f"{value:.2f}"
+
+def startup(statement, repeat):
+    """새 인터프리터에서 statement를 실행하는 데 걸린 시간(ms)의 중앙값"""
+    cwd = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        subprocess.run([sys.executable, '-c', statement], cwd=cwd, check=True)
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, nargs='+', default=[100, 1000, 5000])
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    import pandas as pd
+    paths = {'dataframe': dataframe_ops(pd), 'records': table_ops()}
+
+    print(f"{'rows':>6} {'op':>7} {'dataframe ms':>13} {'records cold':>13} {'records cached':>15}")
+    for rows in args.rows:
+        content = make_csv(rows)
+        cached = cached_table_ops(ProjectTable.parse(content))
+        for op in ['get', 'add', 'update', 'commit']:
+            df_ms = measure(paths['dataframe'][op], content, args.repeat) if op != 'commit' else None
+            cold_ms = measure(paths['records'][op], content, args.repeat) if op != 'commit' else None
+            cached_ms = measure(cached[op], content, args.repeat)
+            print(f"{rows:>6} {op:>7} {_ms(df_ms):>13} {_ms(cold_ms):>13} {_ms(cached_ms):>15}")
+
+    print()
+    print(f"{'startup':>26} {'ms':>8}")
+    for label, statement in [
+        ('python', 'pass'),
+        ('import pandas', 'import pandas'),
+        ('import project_records', 'import project_records'),
+        ('import app', 'import app'),
+    ]:
+        print(f"{label:>26} {startup(statement, 5):>8.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,197 @@
+"""로컬 가짜 GitHub를 상대로 Flask 앱의 처리량과 p99 지연을 재는 부하 테스트
+
+    cd flask_server
+    python benchmarks/load_test.py --sizes 1000 5000 --concurrency 1 8 32 --latency 0.05
+
+설정마다 FakeGitHub를 새로 띄워 --sizes 행의 CSV를 심고, 앱을 별도 프로세스로 실행한 뒤
+read(조회만)와 mixed(--write-ratio 비율로 wait=false PUT 섞음) 부하를 --duration초 동안 건다.
+결과 표의 github 열은 해당 구간에 가짜 GitHub가 받은 요청 수이고,
+앱의 /metrics 출력은 --metrics-dir를 주면 설정별 파일로 저장한다.
+"""
+import argparse
+import json
+import logging
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import threading
+import time
+
+import requests
+
+SERVER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, SERVER_DIR)
+
+from fake_github import FakeGitHub
+from benchmarks.bench_records import make_csv
+
+CSV_PATH = 'assets/project_list.csv'
+READ_PATHS = [
+    '/api/projects',
+    '/api/projects?status=진행중&limit=50',
+    '/api/projects?manager=담당3&sort=end_date',
+    '/api/projects/stats',
+]
+STATUSES = ['진행중', '대기', '완료']
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+def start_app(github_url, port, cache_ttl):
+    """가짜 GitHub를 바라보는 앱을 새 프로세스로 띄우고 응답할 때까지 대기"""
+    env = dict(
+        os.environ,
+        GITHUB_API_URL=github_url,
+        GITHUB_TOKEN='load-test',
+        PROJECT_STORE='github',
+        PROJECT_CACHE_TTL=str(cache_ttl),
+        DATABASE_URL='sqlite://',
+    )
+    process = subprocess.Popen(
+        [sys.executable, '-c',
+         f"from app import app; app.run(port={port}, threaded=True)"],
+        cwd=SERVER_DIR, env=env,
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError('app exited during startup')
+        try:
+            if requests.get(f"{base_url}/api/projects?limit=1", timeout=5).status_code == 200:
+                return process, base_url
+        except requests.ConnectionError:
+            pass
+        time.sleep(0.2)
+    process.kill()
+    raise RuntimeError('app did not become ready')
+
+def percentile(samples, q):
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def run_load(base_url, size, concurrency, duration, write_ratio, seed):
+    """concurrency개 스레드로 duration초 동안 요청을 보내고 (지연 목록, 오류 수) 반환"""
+    latencies = []
+    errors = [0]
+    lock = threading.Lock()
+    deadline = time.monotonic() + duration
+
+    def worker(index):
+        rng = random.Random(seed + index)
+        session = requests.Session()
+        local, failed = [], 0
+        while time.monotonic() < deadline:
+            if rng.random() < write_ratio:
+                project_id = f"p{rng.randrange(size)}"
+                method, url = 'PUT', f"{base_url}/api/projects/{project_id}?wait=false"
+                body = {'status': rng.choice(STATUSES)}
+            else:
+                method, url, body = 'GET', base_url + rng.choice(READ_PATHS), None
+            started = time.perf_counter()
+            try:
+                response = session.request(method, url, json=body, timeout=30)
+                response.content
+                ok = response.status_code < 400
+            except requests.RequestException:
+                ok = False
+            local.append(time.perf_counter() - started)
+            failed += not ok
+        with lock:
+            latencies.extend(local)
+            errors[0] += failed
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return latencies, errors[0]
+
+
+def run_case(args, size, concurrency, workload, write_ratio):
+    fake = FakeGitHub(latency=args.latency, rate_limit=10 ** 9)
+    fake.put_file(CSV_PATH, make_csv(size))
+    github_url = fake.start()
+    process, base_url = start_app(github_url, free_port(), args.cache_ttl)
+    try:
+        # 첫 파싱과 인덱스 생성은 측정에서 제외
+        for path in READ_PATHS:
+            requests.get(base_url + path, timeout=30)
+        github_before = fake.requests
+        latencies, errors = run_load(
+            base_url, size, concurrency, args.duration, write_ratio, args.seed
+        )
+        github_calls = fake.requests - github_before
+        if args.metrics_dir:
+            os.makedirs(args.metrics_dir, exist_ok=True)
+            name = f"{workload}-{size}-c{concurrency}.prom"
+            with open(os.path.join(args.metrics_dir, name), 'w', encoding='utf-8') as f:
+                f.write(requests.get(f"{base_url}/metrics", timeout=30).text)
+    finally:
+        process.terminate()
+        process.wait()
+        fake.stop()
+
+    return {
+        'workload': workload,
+        'size': size,
+        'concurrency': concurrency,
+        'latency': args.latency,
+        'requests': len(latencies),
+        'errors': errors,
+        'throughput': len(latencies) / args.duration,
+        'p50_ms': statistics.median(latencies) * 1000 if latencies else None,
+        'p99_ms': percentile(latencies, 0.99) * 1000 if latencies else None,
+        'github_calls': github_calls,
+    }
+
+def _ms(value):
+    return '-' if value is None else f"{value:.1f}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 5000])
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 8, 32])
+    parser.add_argument('--workloads', nargs='+', choices=['read', 'mixed'], default=['read', 'mixed'])
+    parser.add_argument('--duration', type=float, default=10.0, help='seconds per configuration')
+    parser.add_argument('--latency', type=float, default=0.05, help='fake GitHub latency per call (s)')
+    parser.add_argument('--write-ratio', type=float, default=0.1, help='share of PUTs in the mixed workload')
+    parser.add_argument('--cache-ttl', type=float, default=10.0, help='PROJECT_CACHE_TTL for the app')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help='write results as JSON')
+    parser.add_argument('--metrics-dir', help='save the /metrics scrape of each run here')
+    args = parser.parse_args()
+    logging.getLogger('werkzeug').setLevel(logging.ERROR)
+
+    results = []
+    print(f"{'workload':>8} {'rows':>6} {'conc':>5} {'req/s':>8} {'p50 ms':>8} "
+          f"{'p99 ms':>8} {'errors':>7} {'github':>7}")
+    for workload in args.workloads:
+        write_ratio = args.write_ratio if workload == 'mixed' else 0.0
+        for size in args.sizes:
+            for concurrency in args.concurrency:
+                result = run_case(args, size, concurrency, workload, write_ratio)
+                results.append(result)
+                print(f"{workload:>8} {size:>6} {concurrency:>5} {result['throughput']:>8.1f} "
+                      f"{_ms(result['p50_ms']):>8} {_ms(result['p99_ms']):>8} "
+                      f"{result['errors']:>7} {result['github_calls']:>7}", flush=True)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'args': vars(args), 'results': results}, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == '__main__':
+    main()
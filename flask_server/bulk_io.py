@@ -0,0 +1,187 @@
+import codecs
+import csv
+import io
+import uuid
+from datetime import datetime
+from project_records import PROJECT_FIELDS
+
+# assets/task_list*.csv의 한글 헤더 -> 프로젝트 열
+KOREAN_HEADERS = {
+    '구분': 'category',
+    '분류': 'subCategory',
+    '상세': 'detail',
+    '업무내용': 'description',
+    '담당': 'manager',
+    '관리': 'supervisor',
+    '업무절차': 'procedure',
+}
+DATE_FIELDS = ['start_date', 'end_date']
+REQUIRED_FIELDS = ['name', 'category']
+SNIFF_SIZE = 64 * 1024
+CHUNK_SIZE = 64 * 1024
+
+
+class UploadError(ValueError):
+    """업로드 파일 자체를 읽을 수 없을 때"""
+
+
+def detect_encoding(head):
+    """앞부분 바이트로 인코딩 판별 (UTF-8 BOM, UTF-8, CP949 순)"""
+    if head.startswith(codecs.BOM_UTF8):
+        return 'utf-8-sig'
+    try:
+        # 잘린 멀티바이트 문자는 허용하도록 final=False로 디코딩
+        codecs.getincrementaldecoder('utf-8')().decode(head, final=False)
+        return 'utf-8'
+    except UnicodeDecodeError:
+        return 'cp949'
+
+
+class _PrefixedStream(io.RawIOBase):
+    """인코딩 판별에 읽은 앞부분을 다시 붙여 원래 스트림처럼 읽게 함"""
+
+    def __init__(self, head, stream):
+        self._head = head
+        self._stream = stream
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        if self._head:
+            size = min(len(buffer), len(self._head))
+            buffer[:size] = self._head[:size]
+            self._head = self._head[size:]
+            return size
+        data = self._stream.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+
+def iter_csv_rows(stream):
+    """업로드된 CSV를 청크 단위로 디코딩하며 dict 행을 하나씩 반환"""
+    head = stream.read(SNIFF_SIZE)
+    encoding = detect_encoding(head)
+    raw = io.BufferedReader(_PrefixedStream(head, stream), buffer_size=CHUNK_SIZE)
+    text = io.TextIOWrapper(raw, encoding=encoding, newline='')
+    try:
+        yield from csv.DictReader(text)
+    except UnicodeDecodeError:
+        raise UploadError(f'cannot decode file as {encoding}')
+
+def iter_excel_rows(stream):
+    """엑셀(xlsx) 첫 시트를 읽기 전용 모드로 한 행씩 읽음"""
+    try:
+        import openpyxl
+    except ImportError:
+        raise UploadError('excel import requires openpyxl')
+
+    workbook = openpyxl.load_workbook(stream, read_only=True, data_only=True)
+    try:
+        rows = workbook.worksheets[0].iter_rows(values_only=True)
+        header = [str(cell).strip() if cell is not None else '' for cell in next(rows, [])]
+        for row in rows:
+            yield {key: value for key, value in zip(header, row)}
+    finally:
+        workbook.close()
+
+def iter_upload_rows(filename, stream):
+    """파일 확장자에 따라 CSV 또는 엑셀 행 반복자를 선택"""
+    if filename.lower().endswith(('.xlsx', '.xlsm')):
+        return iter_excel_rows(stream)
+    return iter_csv_rows(stream)
+
+
+def normalize_row(row, now):
+    """한글/영문 헤더 행을 프로젝트 dict로 변환하고 빈 값을 채움"""
+    project = {}
+    for key, value in row.items():
+        if key is None:
+            continue
+        key = key.strip().lstrip('\ufeff')
+        field = KOREAN_HEADERS.get(key, key)
+        if field in PROJECT_FIELDS:
+            project[field] = '' if value is None else str(value).strip()
+
+    for field in PROJECT_FIELDS:
+        project.setdefault(field, '')
+    # 업무 목록에는 이름 열이 없으므로 상세를 이름으로 사용
+    if not project['name']:
+        project['name'] = project['detail']
+    if not project['id']:
+        project['id'] = uuid.uuid4().hex
+    if not project['created_at']:
+        project['created_at'] = now
+    if not project['updated_at']:
+        project['updated_at'] = now
+    return project
+
+def validate_row(project, seen_ids, existing_ids):
+    """행 하나의 오류 메시지 목록 (비어 있으면 유효)"""
+    errors = []
+    for field in REQUIRED_FIELDS:
+        if not project[field]:
+            errors.append(f'{field} is required')
+    for field in DATE_FIELDS:
+        if project[field]:
+            try:
+                datetime.fromisoformat(project[field])
+            except ValueError:
+                errors.append(f'{field} is not an ISO date: {project[field]}')
+    if project['id'] in seen_ids or project['id'] in existing_ids:
+        errors.append(f"duplicate id: {project['id']}")
+    return errors
+
+def read_projects(rows, existing_ids, batch_size=500):
+    """행을 batch_size 단위로 정규화/검증해 (유효한 프로젝트, 행별 오류)를 반환
+
+    existing_ids(ids)는 이미 저장된 id 집합을 돌려주며 배치마다 한 번 호출된다.
+    행 번호는 헤더를 1행으로 센 레코드 기준이다.
+    """
+    now = datetime.now().isoformat()
+    projects = []
+    errors = []
+    seen_ids = set()
+    batch = []
+
+    def flush():
+        existing = existing_ids([project['id'] for _, project in batch]) if batch else set()
+        for line, project in batch:
+            row_errors = validate_row(project, seen_ids, existing)
+            if row_errors:
+                errors.append({'row': line, 'errors': row_errors})
+            else:
+                seen_ids.add(project['id'])
+                projects.append(project)
+        batch.clear()
+
+    for line, row in enumerate(rows, start=2):
+        if not any(value not in (None, '') for value in row.values()):
+            continue
+        batch.append((line, normalize_row(row, now)))
+        if len(batch) >= batch_size:
+            flush()
+    flush()
+    return projects, errors
+
+
+def iter_csv_export(projects, fields=PROJECT_FIELDS):
+    """프로젝트를 CSV로 한 줄씩 직렬화 (엑셀 호환을 위해 BOM 포함)"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    def drain():
+        data = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return data
+
+    buffer.write('\ufeff')
+    writer.writerow(fields)
+    for project in projects:
+        writer.writerow(['' if project.get(field) is None else project.get(field)
+                         for field in fields])
+        # 행마다 내보내지 않고 적당한 크기로 모아서 전송
+        if buffer.tell() >= CHUNK_SIZE:
+            yield drain()
+    yield drain()
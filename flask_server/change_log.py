@@ -0,0 +1,105 @@
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+
+
+class ChangeLog:
+    """최근 프로젝트 변경을 제한된 개수만 보관하는 변경 로그 (delta sync용)
+
+    커서는 "<epoch>.<seq>" 형식이다. 오래되었거나 알 수 없는 커서는 전체 스냅샷으로 응답해야 한다.
+
+    저장소가 버전(GitHub 저장소는 blob SHA)을 알려주면 커서는 "<버전>.0"이 되어 워커와
+    무관하게 그 내용을 가리킨다 (같은 내용이면 어느 워커에서든 커서와 ETag가 같다).
+    로그는 지나온 버전별 위치를 기억해 두므로 다른 워커가 발급한 커서도 이 워커가
+    같은 버전을 거쳤다면 이어서 응답한다.
+    버전이 없으면(SQL 저장소) epoch는 프로세스마다 임의 값이고 커서는 발급한 워커에서만 유효하다.
+    """
+
+    def __init__(self, max_entries=None):
+        if max_entries is None:
+            max_entries = int(os.getenv('CHANGE_LOG_SIZE', '1000'))
+        self._entries = deque(maxlen=max_entries)
+        self._lock = threading.Lock()
+        self._epoch = uuid.uuid4().hex[:8]
+        self._seq = 0
+        # 버전 epoch -> 그 버전이었던 시점의 seq (같은 내용으로 돌아오면 마지막 위치)
+        self._versions = OrderedDict()
+
+    def reset(self, projects, version=None):
+        """저장소 전체를 다시 읽었을 때 호출 (이전 커서는 모두 무효)"""
+        with self._lock:
+            self._seq = 0
+            self._entries.clear()
+            self._versions.clear()
+            if version:
+                self._mark(version)
+            else:
+                self._epoch = uuid.uuid4().hex[:8]
+
+    def mark(self, version):
+        """자체 커밋으로 저장소가 version이 되었음을 기록"""
+        with self._lock:
+            self._mark(version)
+
+    def _mark(self, version):
+        self._epoch = str(version)[:12]
+        self._versions.pop(self._epoch, None)
+        self._versions[self._epoch] = self._seq
+        # 로그에서 밀려난 위치는 더 이상 이어서 응답할 수 없음
+        oldest = self._entries[0][0] if self._entries else self._seq + 1
+        while self._versions and next(iter(self._versions.values())) < oldest - 1:
+            self._versions.popitem(last=False)
+
+    def apply(self, old, new):
+        """변경 하나를 기록 (new가 None이면 삭제 tombstone)"""
+        project_id = (new or old or {}).get('id')
+        if project_id is None:
+            return
+        with self._lock:
+            self._seq += 1
+            self._entries.append((self._seq, str(project_id), new, time.time()))
+
+    def cursor(self):
+        """현재 시점의 커서"""
+        with self._lock:
+            return self._cursor()
+
+    def _cursor(self):
+        if self._epoch in self._versions:
+            return f"{self._epoch}.0"
+        return f"{self._epoch}.{self._seq}"
+
+    def changes_since(self, cursor):
+        """커서 이후의 (upserts, 삭제된 id 목록, 새 커서)를 반환
+
+        커서가 너무 오래되었거나 알 수 없으면 None을 반환한다.
+        """
+        try:
+            epoch, seq = cursor.split('.')
+            seq = int(seq)
+        except (AttributeError, ValueError):
+            return None
+
+        with self._lock:
+            if epoch in self._versions:
+                # seq는 발급한 워커 기준이므로 버전이 기록된 위치부터 응답
+                seq = self._versions[epoch]
+            elif epoch != self._epoch or seq > self._seq:
+                return None
+            oldest = self._entries[0][0] if self._entries else self._seq + 1
+            if seq < oldest - 1:
+                return None
+
+            # 같은 프로젝트의 여러 변경은 마지막 상태만 남김
+            latest = {}
+            for entry_seq, project_id, project, _ in self._entries:
+                if entry_seq > seq:
+                    latest.pop(project_id, None)
+                    latest[project_id] = project
+            next_cursor = self._cursor()
+
+        upserts = [project for project in latest.values() if project is not None]
+        deletes = [project_id for project_id, project in latest.items() if project is None]
+        return upserts, deletes, next_cursor
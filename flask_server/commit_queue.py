@@ -0,0 +1,172 @@
+import contextlib
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from metrics import timed
+
+CONFLICT_STATUS_CODES = (409, 422)
+
+
+class DuplicateProjectError(ValueError):
+    """추가하려는 id가 이미 저장되어 있음"""
+
+
+class ProjectOperation:
+    """커밋 대기 중인 프로젝트 변경 하나 (add / update / delete / import)
+
+    import는 projects 목록 전체를 한 번에 추가한다.
+    """
+
+    def __init__(self, kind, project_id=None, project=None, message=None, projects=None):
+        self.kind = kind
+        self.project_id = project_id
+        self.project = project
+        self.projects = projects
+        self.message = message or f"{kind.capitalize()} project: {project_id}"
+        # 적용 시 채워지는 (이전, 이후) 프로젝트 상태 목록
+        self.changes = []
+
+
+class PendingWrite:
+    """제출된 변경의 진행 상태를 추적하는 토큰"""
+
+    def __init__(self, operation):
+        self.token = uuid.uuid4().hex
+        self.operation = operation
+        self.status = 'pending'
+        self.error = None
+        self.sha = None
+        self._done = threading.Event()
+
+    def finish(self, status, error=None, sha=None):
+        self.status = status
+        self.error = error
+        self.sha = sha
+        self._done.set()
+
+    def wait(self, timeout=None):
+        """커밋이 끝날 때까지 대기하고, 시간 안에 끝났으면 True"""
+        return self._done.wait(timeout)
+
+    def to_dict(self):
+        return {
+            'token': self.token,
+            'status': self.status,
+            'error': self.error,
+            'sha': self.sha,
+        }
+
+
+class CommitQueue:
+    """짧은 시간 창 안에 들어온 변경을 하나의 커밋으로 묶어 GitHub에 반영
+
+    SHA 충돌(409/422)이 나면 최신 내용을 다시 읽어 대기 중인 변경을 재적용한 뒤 재시도한다.
+    commit_lock이 주어지면 GitHub 커밋부터 on_commit 호출까지 그 잠금을 쥔다.
+    on_commit(applied, sha, value)가 주어지면 커밋된 값을 캐시에 반영하는 것도 그 몫이고,
+    invalidate는 커밋하지 못했을 때만 호출한다.
+    """
+
+    def __init__(self, github_service, path, load, apply, serialize, invalidate,
+                 window=None, max_batch=100, max_retries=5, max_tracked=1000,
+                 on_commit=None, commit_lock=None):
+        self.github_service = github_service
+        self.path = path
+        self.load = load
+        self.apply = apply
+        self.serialize = serialize
+        self.invalidate = invalidate
+        self.on_commit = on_commit
+        self.commit_lock = commit_lock or contextlib.nullcontext()
+        if window is None:
+            window = float(os.getenv('COMMIT_WINDOW_SECONDS', '0.5'))
+        self.window = window
+        self.max_batch = max_batch
+        self.max_retries = max_retries
+        self.max_tracked = max_tracked
+        self._queue = []
+        self._writes = OrderedDict()
+        self._cond = threading.Condition()
+        self._worker = None
+
+    def submit(self, operation):
+        """변경을 큐에 넣고 PendingWrite 토큰을 반환"""
+        pending = PendingWrite(operation)
+        with self._cond:
+            self._writes[pending.token] = pending
+            while len(self._writes) > self.max_tracked:
+                self._writes.popitem(last=False)
+            self._queue.append(pending)
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._run, name='commit-queue', daemon=True)
+                self._worker.start()
+            self._cond.notify()
+        return pending
+
+    def get(self, token):
+        """토큰으로 PendingWrite 조회"""
+        with self._cond:
+            return self._writes.get(token)
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._queue:
+                    self._cond.wait()
+            # 첫 변경이 들어온 뒤 잠시 기다려 뒤따르는 변경을 함께 묶음
+            time.sleep(self.window)
+            with self._cond:
+                batch = self._queue[:self.max_batch]
+                del self._queue[:self.max_batch]
+            try:
+                self._commit(batch)
+            except Exception as e:
+                for pending in batch:
+                    if pending.status == 'pending':
+                        pending.finish('failed', str(e))
+
+    def _commit(self, batch):
+        for _ in range(self.max_retries):
+            value, sha = self.load()
+            applied = []
+            for pending in batch:
+                try:
+                    value = self.apply(value, pending.operation)
+                    applied.append(pending)
+                except KeyError:
+                    pending.finish('failed', 'not_found')
+                except DuplicateProjectError:
+                    pending.finish('failed', 'duplicate')
+            if not applied:
+                return
+
+            if len(applied) == 1:
+                message = applied[0].operation.message
+            else:
+                message = f"Update projects ({len(applied)} changes)"
+
+            with timed('serialize'):
+                content = self.serialize(value)
+            with self.commit_lock:
+                status_code, new_sha = self.github_service.commit_file(
+                    self.path, content, message, sha
+                )
+                committed = status_code in [200, 201]
+                if committed and self.on_commit is not None:
+                    self.on_commit(applied, new_sha, value)
+            if not committed or self.on_commit is None:
+                self.invalidate()
+            if committed:
+                for pending in applied:
+                    pending.finish('committed', sha=new_sha)
+                return
+            if status_code not in CONFLICT_STATUS_CODES:
+                for pending in applied:
+                    pending.finish('failed', f'github_status_{status_code}')
+                return
+            # 충돌: 최신 내용 위에 실패하지 않은 변경만 다시 적용
+            batch = applied
+
+        for pending in batch:
+            pending.finish('failed', 'conflict')
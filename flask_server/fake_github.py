@@ -0,0 +1,241 @@
+"""GitHub REST API를 흉내 내는 로컬 서버
+
+GitHubService가 쓰는 contents API와 Git Data API(blobs/trees/commits/refs)만 구현한다.
+GITHUB_API_URL을 이 서버로 지정하면 실제 GitHub 없이 앱을 실행하거나 부하 테스트를 할 수 있다.
+
+    python fake_github.py --port 8765 --latency 0.05 --seed ../assets/project_list.csv
+"""
+import argparse
+import base64
+import hashlib
+import threading
+import time
+from flask import Flask, jsonify, request
+from werkzeug.serving import make_server
+
+
+def git_sha(kind, data):
+    """git과 같은 방식으로 객체 SHA를 계산"""
+    return hashlib.sha1(f"{kind} {len(data)}\0".encode() + data).hexdigest()
+
+
+class FakeGitHub:
+    """브랜치 하나를 가진 메모리 저장소와 그 위의 API 서버
+
+    latency: 모든 응답 전에 기다리는 시간(초)
+    fail_next(n, status): 다음 n개 요청을 status로 실패시킴 (재시도 확인용)
+    """
+
+    def __init__(self, branch='main', latency=0.0, rate_limit=5000,
+                 contents_limit=1024 * 1024):
+        self.branch = branch
+        self.latency = latency
+        self.rate_limit = rate_limit
+        self.remaining = rate_limit
+        self.contents_limit = contents_limit
+        self.blobs = {}
+        self.trees = {}
+        self.commits = {}
+        self.lock = threading.Lock()
+        self.requests = 0
+        self._failures = []
+        self.head = self._make_commit({}, 'Initial commit', [])
+        self.app = self._create_app()
+
+    # 저장소 조작
+
+    def _make_blob(self, data):
+        sha = git_sha('blob', data)
+        self.blobs[sha] = data
+        return sha
+
+    def _make_tree(self, entries):
+        sha = git_sha('tree', repr(sorted(entries.items())).encode())
+        self.trees[sha] = dict(entries)
+        return sha
+
+    def _make_commit(self, entries, message, parents):
+        tree = self._make_tree(entries)
+        data = f"{tree}{parents}{message}{time.time()}".encode()
+        sha = git_sha('commit', data)
+        self.commits[sha] = {'tree': tree, 'parents': parents, 'message': message}
+        return sha
+
+    def _files(self, ref=None):
+        commit = self.commits.get(ref or self.head)
+        if commit is None:
+            return None
+        return self.trees[commit['tree']]
+
+    def put_file(self, path, content):
+        """테스트/벤치마크 준비용으로 파일을 직접 커밋"""
+        with self.lock:
+            files = dict(self._files())
+            files[path] = self._make_blob(content.encode())
+            self.head = self._make_commit(files, f"Seed {path}", [self.head])
+            return files[path]
+
+    def read_file(self, path):
+        with self.lock:
+            sha = self._files().get(path)
+            return self.blobs[sha].decode() if sha else None
+
+    def fail_next(self, count, status=502, headers=None):
+        with self.lock:
+            self._failures.extend([(status, headers or {})] * count)
+
+    # HTTP 서버
+
+    def _create_app(self):
+        app = Flask(__name__)
+        fake = self
+
+        @app.before_request
+        def before():
+            if fake.latency:
+                time.sleep(fake.latency)
+            with fake.lock:
+                fake.requests += 1
+                if fake._failures:
+                    status, headers = fake._failures.pop(0)
+                    return jsonify({'message': 'injected failure'}), status, headers
+
+        @app.after_request
+        def after(response):
+            # 304 응답은 rate limit을 소모하지 않음
+            with fake.lock:
+                if response.status_code != 304:
+                    fake.remaining = max(fake.remaining - 1, 0)
+                response.headers['X-RateLimit-Limit'] = str(fake.rate_limit)
+                response.headers['X-RateLimit-Remaining'] = str(fake.remaining)
+                response.headers['X-RateLimit-Reset'] = str(int(time.time()) + 3600)
+            return response
+
+        @app.route('/repos/<owner>/<repo>/contents/<path:path>', methods=['GET'])
+        def get_contents(owner, repo, path):
+            ref = request.args.get('ref')
+            with fake.lock:
+                files = fake._files(None if ref in (None, fake.branch) else ref)
+                if files is None or path not in files:
+                    return jsonify({'message': 'Not Found'}), 404
+                sha = files[path]
+                etag = f'"{sha}"'
+                if request.headers.get('If-None-Match') == etag:
+                    return '', 304, {'ETag': etag}
+                data = fake.blobs[sha]
+            body = {'path': path, 'sha': sha, 'size': len(data)}
+            if len(data) > fake.contents_limit:
+                body.update({'encoding': 'none', 'content': ''})
+            else:
+                body.update({'encoding': 'base64', 'content': base64.b64encode(data).decode()})
+            return jsonify(body), 200, {'ETag': etag}
+
+        @app.route('/repos/<owner>/<repo>/contents/<path:path>', methods=['PUT'])
+        def put_contents(owner, repo, path):
+            data = request.json
+            with fake.lock:
+                files = dict(fake._files())
+                current = files.get(path)
+                if current is not None and not data.get('sha'):
+                    return jsonify({'message': '"sha" wasn\'t supplied.'}), 422
+                if current is not None and data['sha'] != current:
+                    return jsonify({'message': f'{path} does not match {data["sha"]}'}), 409
+                files[path] = fake._make_blob(base64.b64decode(data['content']))
+                fake.head = fake._make_commit(files, data['message'], [fake.head])
+                status = 200 if current is not None else 201
+                return jsonify({'content': {'path': path, 'sha': files[path]},
+                                'commit': {'sha': fake.head}}), status
+
+        @app.route('/repos/<owner>/<repo>/git/ref/heads/<branch>', methods=['GET'])
+        def get_ref(owner, repo, branch):
+            with fake.lock:
+                return jsonify({'ref': f'refs/heads/{branch}', 'object': {'sha': fake.head}})
+
+        @app.route('/repos/<owner>/<repo>/git/refs/heads/<branch>', methods=['PATCH'])
+        def update_ref(owner, repo, branch):
+            data = request.json
+            with fake.lock:
+                commit = fake.commits.get(data['sha'])
+                if commit is None:
+                    return jsonify({'message': 'Object does not exist'}), 422
+                if fake.head not in commit['parents'] and not data.get('force'):
+                    return jsonify({'message': 'Update is not a fast forward'}), 422
+                fake.head = data['sha']
+                return jsonify({'ref': f'refs/heads/{branch}', 'object': {'sha': fake.head}})
+
+        @app.route('/repos/<owner>/<repo>/git/commits/<sha>', methods=['GET'])
+        def get_commit(owner, repo, sha):
+            with fake.lock:
+                commit = fake.commits.get(sha)
+                if commit is None:
+                    return jsonify({'message': 'Not Found'}), 404
+                return jsonify({'sha': sha, 'tree': {'sha': commit['tree']},
+                                'parents': [{'sha': p} for p in commit['parents']]})
+
+        @app.route('/repos/<owner>/<repo>/git/commits', methods=['POST'])
+        def create_commit(owner, repo):
+            data = request.json
+            with fake.lock:
+                if data['tree'] not in fake.trees:
+                    return jsonify({'message': 'Tree not found'}), 422
+                tree = fake.trees[data['tree']]
+                sha = fake._make_commit(tree, data['message'], data.get('parents', []))
+                return jsonify({'sha': sha}), 201
+
+        @app.route('/repos/<owner>/<repo>/git/blobs', methods=['POST'])
+        def create_blob(owner, repo):
+            data = request.json
+            content = data['content']
+            raw = base64.b64decode(content) if data.get('encoding') == 'base64' else content.encode()
+            with fake.lock:
+                return jsonify({'sha': fake._make_blob(raw)}), 201
+
+        @app.route('/repos/<owner>/<repo>/git/blobs/<sha>', methods=['GET'])
+        def get_blob(owner, repo, sha):
+            with fake.lock:
+                if sha not in fake.blobs:
+                    return jsonify({'message': 'Not Found'}), 404
+                data = fake.blobs[sha]
+            return jsonify({'sha': sha, 'size': len(data), 'encoding': 'base64',
+                            'content': base64.b64encode(data).decode()})
+
+        @app.route('/repos/<owner>/<repo>/git/trees', methods=['POST'])
+        def create_tree(owner, repo):
+            data = request.json
+            with fake.lock:
+                base = fake.trees.get(data.get('base_tree'), {})
+                entries = dict(base)
+                for entry in data['tree']:
+                    if entry.get('sha') is None:
+                        entries.pop(entry['path'], None)
+                    elif entry['sha'] not in fake.blobs:
+                        return jsonify({'message': 'Blob not found'}), 422
+                    else:
+                        entries[entry['path']] = entry['sha']
+                return jsonify({'sha': fake._make_tree(entries)}), 201
+
+        return app
+
+    def start(self, host='127.0.0.1', port=0):
+        """백그라운드 스레드에서 서버를 띄우고 base URL을 반환"""
+        self._server = make_server(host, port, self.app, threaded=True)
+        thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        thread.start()
+        return f"http://{host}:{self._server.server_port}"
+
+    def stop(self):
+        self._server.shutdown()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Local stand-in for the GitHub API')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency', type=float, default=0.0)
+    parser.add_argument('--seed', help='CSV file to serve as assets/project_list.csv')
+    args = parser.parse_args()
+
+    fake = FakeGitHub(latency=args.latency)
+    if args.seed:
+        with open(args.seed, encoding='utf-8') as f:
+            fake.put_file('assets/project_list.csv', f.read())
+    fake.app.run(port=args.port, threaded=True)
@@ -1,48 +1,274 @@
 import os
 import base64
+import random
+import threading
+import time
 import requests
+from requests.adapters import HTTPAdapter
 from dotenv import load_dotenv
+from metrics import GITHUB_BYTES, GITHUB_CALLS, timed
 
 load_dotenv()
 
+# contents API는 이보다 큰 파일의 내용을 응답에 싣지 않는다
+CONTENTS_API_LIMIT = 1024 * 1024
+
 class GitHubService:
     def __init__(self):
         self.token = os.getenv('GITHUB_TOKEN')
-        self.repo = 'photo2story/task_master'
-        self.branch = 'main'
-        self.base_url = 'https://api.github.com'
+        self.repo = os.getenv('GITHUB_REPO', 'photo2story/task_master')
+        self.branch = os.getenv('GITHUB_BRANCH', 'main')
+        self.base_url = os.getenv('GITHUB_API_URL', 'https://api.github.com')
+        self.timeout = float(os.getenv('GITHUB_TIMEOUT', '10'))
+        self.max_retries = int(os.getenv('GITHUB_MAX_RETRIES', '4'))
+        self.backoff_base = float(os.getenv('GITHUB_BACKOFF_BASE', '0.5'))
+        self.backoff_max = float(os.getenv('GITHUB_BACKOFF_MAX', '30'))
+        self.large_file_threshold = int(os.getenv('GITHUB_LARGE_FILE_THRESHOLD', CONTENTS_API_LIMIT))
+
+        # 연결을 재사용하도록 세션 하나를 풀과 함께 공유
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers.update({
+            'Authorization': f'token {self.token}',
+            'Accept': 'application/vnd.github.v3+json'
+        })
+
+        self._stats_lock = threading.Lock()
+        self.calls = 0
+        self.retries = 0
+        self.errors = 0
+        self.latency_total = 0.0
+        self.last_latency = None
+        self.rate_limit_remaining = None
+        self.rate_limit_reset = None
+
+    def _record(self, method, response, latency):
+        GITHUB_CALLS.inc(method=method, status=str(response.status_code) if response is not None else 'error')
+        if response is not None:
+            body = response.request.body or b''
+            GITHUB_BYTES.inc(len(body), direction='sent')
+            GITHUB_BYTES.inc(len(response.content), direction='received')
+        with self._stats_lock:
+            self.calls += 1
+            self.latency_total += latency
+            self.last_latency = latency
+            if response is None:
+                self.errors += 1
+                return
+            remaining = response.headers.get('X-RateLimit-Remaining')
+            if remaining is not None:
+                self.rate_limit_remaining = int(remaining)
+            reset = response.headers.get('X-RateLimit-Reset')
+            if reset is not None:
+                self.rate_limit_reset = int(reset)
+
+    def _is_rate_limited(self, response):
+        if response.status_code == 429:
+            return True
+        if response.status_code != 403:
+            return False
+        # 기본 rate limit 소진 또는 secondary rate limit
+        return (response.headers.get('X-RateLimit-Remaining') == '0'
+                or 'Retry-After' in response.headers
+                or 'rate limit' in response.text.lower())
+
+    def _retry_delay(self, response, attempt):
+        """Retry-After, rate limit 초기화 시각, 지수 백오프(지터) 순으로 대기 시간 결정"""
+        if response is not None:
+            retry_after = response.headers.get('Retry-After')
+            if retry_after is not None:
+                try:
+                    return min(float(retry_after), self.backoff_max)
+                except ValueError:
+                    pass
+            if response.headers.get('X-RateLimit-Remaining') == '0':
+                reset = response.headers.get('X-RateLimit-Reset')
+                if reset is not None:
+                    return min(max(int(reset) - time.time(), 0), self.backoff_max)
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+    def _request(self, method, url, idempotent=True, **kwargs):
+        """재시도와 타임아웃을 적용한 요청
+
+        멱등이 아닌 쓰기는 서버가 처리하지 않았음이 확실한 rate limit 응답에만 재시도한다.
+        재시도를 모두 소진한 연결 오류는 None을 반환한다.
+        """
+        for attempt in range(self.max_retries + 1):
+            started = time.perf_counter()
+            try:
+                response = self.session.request(method, url, timeout=self.timeout, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                self._record(method, None, time.perf_counter() - started)
+                if not idempotent or attempt == self.max_retries:
+                    return None
+                response = None
+            else:
+                self._record(method, response, time.perf_counter() - started)
+                retryable = self._is_rate_limited(response) or (
+                    idempotent and response.status_code >= 500
+                )
+                if not retryable or attempt == self.max_retries:
+                    return response
+
+            with self._stats_lock:
+                self.retries += 1
+            time.sleep(self._retry_delay(response, attempt))
+
+    def stats(self):
+        """호출 수, 지연 시간, 남은 rate limit"""
+        with self._stats_lock:
+            return {
+                'calls': self.calls,
+                'retries': self.retries,
+                'errors': self.errors,
+                'avg_latency': self.latency_total / self.calls if self.calls else None,
+                'last_latency': self.last_latency,
+                'rate_limit_remaining': self.rate_limit_remaining,
+                'rate_limit_reset': self.rate_limit_reset,
+            }
+
+    def _decode(self, content):
+        """contents 응답에서 파일 내용을 꺼냄 (1MB 초과 파일은 blob API로 조회)"""
+        if content.get('encoding') == 'base64' and content.get('content') is not None:
+            with timed('decode'):
+                return base64.b64decode(content['content']).decode('utf-8')
+        url = f"{self.base_url}/repos/{self.repo}/git/blobs/{content['sha']}"
+        with timed('fetch'):
+            response = self._request('GET', url)
+        if response is None or response.status_code != 200:
+            return None
+        with timed('decode'):
+            return base64.b64decode(response.json()['content']).decode('utf-8')
 
     def get_file_content(self, path):
         """GitHub에서 파일 내용과 SHA를 가져옴"""
+        _, file_content, sha, _ = self.get_file_if_modified(path)
+        return file_content, sha
+
+    def get_file_if_modified(self, path, etag=None):
+        """ETag(If-None-Match) 조건부 요청으로 파일을 가져옴
+
+        304 응답은 rate limit을 소모하지 않는다.
+        반환값: (not_modified, content, sha, etag)
+        """
         url = f"{self.base_url}/repos/{self.repo}/contents/{path}"
-        headers = {
-            'Authorization': f'token {self.token}',
-            'Accept': 'application/vnd.github.v3+json'
-        }
-        
-        response = requests.get(url, headers=headers)
+        headers = {}
+        if etag:
+            headers['If-None-Match'] = etag
+
+        with timed('fetch'):
+            response = self._request('GET', url, headers=headers, params={'ref': self.branch})
+        if response is None:
+            return False, None, None, None
+        if response.status_code == 304:
+            return True, None, None, etag
         if response.status_code == 200:
             content = response.json()
-            file_content = base64.b64decode(content['content']).decode('utf-8')
-            return file_content, content['sha']
-        return None, None
+            file_content = self._decode(content)
+            if file_content is None:
+                return False, None, None, None
+            return False, file_content, content['sha'], response.headers.get('ETag')
+        return False, None, None, None
 
     def update_file(self, path, content, message, sha=None):
         """GitHub의 파일을 업데이트하거나 생성"""
+        status_code, _ = self.commit_file(path, content, message, sha)
+        return status_code in [200, 201]
+
+    def commit_file(self, path, content, message, sha=None):
+        """파일을 커밋하고 (상태 코드, 새 SHA)를 반환
+
+        SHA가 어긋나면 GitHub은 409 또는 422를 돌려준다.
+        연결 오류는 상태 코드 0으로 반환한다.
+        """
+        with timed('commit'):
+            return self._commit_file(path, content, message, sha)
+
+    def _commit_file(self, path, content, message, sha):
+        encoded = content.encode()
+        if len(encoded) > self.large_file_threshold:
+            return self._commit_large_file(path, encoded, message, sha)
+
         url = f"{self.base_url}/repos/{self.repo}/contents/{path}"
-        headers = {
-            'Authorization': f'token {self.token}',
-            'Accept': 'application/vnd.github.v3+json'
-        }
-        
         data = {
             'message': message,
-            'content': base64.b64encode(content.encode()).decode(),
+            'content': base64.b64encode(encoded).decode(),
             'branch': self.branch
         }
-        
+
         if sha:
             data['sha'] = sha
-            
-        response = requests.put(url, json=data, headers=headers)
-        return response.status_code in [200, 201] 
\ No newline at end of file
+
+        response = self._request('PUT', url, idempotent=False, json=data)
+        if response is None:
+            return 0, None
+        if response.status_code in [200, 201]:
+            return response.status_code, response.json()['content']['sha']
+        return response.status_code, None
+
+    def _create_git_object(self, kind, data):
+        """git/blobs, git/trees, git/commits에 객체를 만들고 (상태 코드, SHA)를 반환"""
+        url = f"{self.base_url}/repos/{self.repo}/git/{kind}"
+        response = self._request('POST', url, idempotent=False, json=data)
+        if response is None:
+            return 0, None
+        if response.status_code != 201:
+            return response.status_code, None
+        return 201, response.json()['sha']
+
+    def _commit_large_file(self, path, encoded, message, sha):
+        """Git Data API(blob -> tree -> commit -> ref)로 큰 파일을 커밋
+
+        파일 SHA가 다르면 409, 그 사이 브랜치가 움직였으면 422를 반환한다.
+        """
+        repo_url = f"{self.base_url}/repos/{self.repo}"
+
+        response = self._request('GET', f"{repo_url}/git/ref/heads/{self.branch}")
+        if response is None or response.status_code != 200:
+            return response.status_code if response is not None else 0, None
+        parent_sha = response.json()['object']['sha']
+
+        response = self._request('GET', f"{repo_url}/git/commits/{parent_sha}")
+        if response is None or response.status_code != 200:
+            return response.status_code if response is not None else 0, None
+        base_tree = response.json()['tree']['sha']
+
+        response = self._request('GET', f"{repo_url}/contents/{path}", params={'ref': parent_sha})
+        if response is None:
+            return 0, None
+        current_sha = response.json()['sha'] if response.status_code == 200 else None
+        if current_sha != sha:
+            return 409, None
+
+        status_code, blob_sha = self._create_git_object('blobs', {
+            'content': base64.b64encode(encoded).decode(),
+            'encoding': 'base64'
+        })
+        if blob_sha is None:
+            return status_code, None
+        status_code, tree_sha = self._create_git_object('trees', {
+            'base_tree': base_tree,
+            'tree': [{'path': path, 'mode': '100644', 'type': 'blob', 'sha': blob_sha}]
+        })
+        if tree_sha is None:
+            return status_code, None
+        status_code, commit_sha = self._create_git_object('commits', {
+            'message': message,
+            'tree': tree_sha,
+            'parents': [parent_sha]
+        })
+        if commit_sha is None:
+            return status_code, None
+
+        # force 없이 갱신하므로 브랜치가 움직였으면 422
+        response = self._request(
+            'PATCH', f"{repo_url}/git/refs/heads/{self.branch}", idempotent=False,
+            json={'sha': commit_sha, 'force': False}
+        )
+        if response is None:
+            return 0, None
+        if response.status_code == 200:
+            return 201, blob_sha
+        return response.status_code, None
@@ -0,0 +1,142 @@
+"""프로세스 전역 지표와 Prometheus 텍스트 형식 출력
+
+prometheus_client 의존성 없이 /metrics에 필요한 카운터와 히스토그램만 구현한다.
+"""
+import threading
+import time
+from contextlib import contextmanager
+
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+def _labels(names, values):
+    if not names:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in zip(names, values)) + '}'
+
+
+class Counter:
+    def __init__(self, name, help, labels=()):
+        self.name = name
+        self.help = help
+        self.label_names = tuple(labels)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount=1, **labels):
+        # 값 종류가 섞여도(200과 'error') 정렬할 수 있도록 문자열로 통일
+        key = tuple(str(labels.get(name, '')) for name in self.label_names)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def render(self):
+        lines = [f'# HELP {self.name} {self.help}', f'# TYPE {self.name} counter']
+        with self._lock:
+            for key, value in sorted(self._values.items()):
+                lines.append(f'{self.name}{_labels(self.label_names, key)} {value}')
+        return lines
+
+
+class Histogram:
+    def __init__(self, name, help, labels=(), buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.help = help
+        self.label_names = tuple(labels)
+        self.buckets = tuple(buckets)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value, **labels):
+        key = tuple(str(labels.get(name, '')) for name in self.label_names)
+        with self._lock:
+            # [버킷별 누적 개수, 합계, 개수]
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [[0] * len(self.buckets), 0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state[0][i] += 1
+            state[1] += value
+            state[2] += 1
+
+    def render(self):
+        lines = [f'# HELP {self.name} {self.help}', f'# TYPE {self.name} histogram']
+        names = self.label_names + ('le',)
+        with self._lock:
+            for key, (counts, total, count) in sorted(self._values.items()):
+                for bound, bucket_count in zip(self.buckets, counts):
+                    lines.append(f'{self.name}_bucket{_labels(names, key + (bound,))} {bucket_count}')
+                lines.append(f'{self.name}_bucket{_labels(names, key + ("+Inf",))} {count}')
+                lines.append(f'{self.name}_sum{_labels(self.label_names, key)} {total}')
+                lines.append(f'{self.name}_count{_labels(self.label_names, key)} {count}')
+        return lines
+
+
+class Gauge:
+    """render 시점에 함수를 불러 값을 읽는 게이지"""
+    type = 'gauge'
+
+    def __init__(self, name, help, read):
+        self.name = name
+        self.help = help
+        self.read = read
+
+    def render(self):
+        value = self.read()
+        lines = [f'# HELP {self.name} {self.help}', f'# TYPE {self.name} {self.type}']
+        if value is not None:
+            lines.append(f'{self.name} {value}')
+        return lines
+
+
+class CounterFunction(Gauge):
+    """다른 객체가 이미 세고 있는 누적 값을 render 시점에 읽어 카운터로 노출"""
+    type = 'counter'
+
+
+class Registry:
+    def __init__(self):
+        self.metrics = []
+
+    def register(self, metric):
+        self.metrics.append(metric)
+        return metric
+
+    def render(self):
+        lines = []
+        for metric in self.metrics:
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
+
+registry = Registry()
+
+REQUEST_LATENCY = registry.register(Histogram(
+    'http_request_duration_seconds', 'Flask request latency by route',
+    labels=('method', 'route', 'status')
+))
+PHASE_LATENCY = registry.register(Histogram(
+    'project_phase_duration_seconds', 'Time spent in fetch/decode/parse/serialize/commit',
+    labels=('phase',)
+))
+GITHUB_CALLS = registry.register(Counter(
+    'github_requests_total', 'GitHub API calls by method and status',
+    labels=('method', 'status')
+))
+GITHUB_BYTES = registry.register(Counter(
+    'github_payload_bytes_total', 'GitHub API payload bytes',
+    labels=('direction',)
+))
+
+
+@contextmanager
+def timed(phase):
+    """with 블록의 실행 시간을 phase 히스토그램에 기록"""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        PHASE_LATENCY.observe(time.perf_counter() - started, phase=phase)
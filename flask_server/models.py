@@ -0,0 +1,34 @@
+from flask_sqlalchemy import SQLAlchemy
+from project_records import PROJECT_FIELDS
+
+db = SQLAlchemy()
+
+
+class Project(db.Model):
+    """project_list.csv와 같은 열 구성을 가진 프로젝트 테이블"""
+    __tablename__ = 'projects'
+
+    id = db.Column(db.String(64), primary_key=True)
+    name = db.Column(db.String(255), nullable=False, default='')
+    category = db.Column(db.String(100), nullable=False, default='', index=True)
+    subCategory = db.Column(db.String(100), nullable=False, default='')
+    description = db.Column(db.Text, nullable=False, default='')
+    detail = db.Column(db.Text, nullable=False, default='')
+    procedure = db.Column(db.Text, nullable=False, default='')
+    start_date = db.Column(db.String(32), nullable=False, default='')
+    end_date = db.Column(db.String(32), nullable=False, default='')
+    status = db.Column(db.String(32), nullable=False, default='', index=True)
+    manager = db.Column(db.String(100), nullable=False, default='', index=True)
+    supervisor = db.Column(db.String(100), nullable=False, default='')
+    created_at = db.Column(db.String(32), nullable=False, default='')
+    updated_at = db.Column(db.String(32), nullable=False, default='')
+    update_notes = db.Column(db.Text, nullable=False, default='')
+
+    def update_from(self, data):
+        """요청 JSON의 값으로 열을 갱신 (id는 유지)"""
+        for field in PROJECT_FIELDS[1:]:
+            if field in data:
+                setattr(self, field, '' if data[field] is None else str(data[field]))
+
+    def to_dict(self):
+        return {field: getattr(self, field) for field in PROJECT_FIELDS}
@@ -0,0 +1,123 @@
+import os
+import threading
+import time
+from metrics import timed
+
+
+class ProjectCache:
+    """blob SHA를 키로 파싱된 프로젝트 목록을 보관하는 프로세스 전역 읽기 캐시
+
+    TTL이 지나면 ETag 조건부 요청으로 재검증하고, SHA가 바뀐 경우에만 다시 파싱한다.
+    """
+
+    def __init__(self, github_service, path, parse, ttl=None):
+        self.github_service = github_service
+        self.path = path
+        self.parse = parse
+        if ttl is None:
+            ttl = float(os.getenv('PROJECT_CACHE_TTL', '10'))
+        self.ttl = ttl
+        self._cond = threading.Condition()
+        self._sha = None
+        self._etag = None
+        self._value = None
+        self._checked_at = 0.0
+        # 재검증은 한 스레드만 하고(single-flight), 그동안 다른 호출은 기존 값을 받는다
+        self._refreshing = False
+        # invalidate() 횟수. 진행 중이던 재검증 결과가 쓰기 이전 것일 수 있어 구분한다
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.errors = 0
+
+    def get(self, fresh=False):
+        """캐시된 (값, sha)를 반환하고 필요하면 GitHub에서 재검증
+
+        GitHub 호출은 잠금 밖에서 하므로 느려져도 다른 읽기는 기존 값으로 바로 응답한다.
+        fresh=True면 진행 중인 재검증을 기다리고 invalidate() 이후의 내용을 돌려준다
+        (커밋 큐처럼 최신 SHA가 필요한 경우).
+        """
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                if self._sha is not None and now - self._checked_at < self.ttl:
+                    self.hits += 1
+                    return self._value, self._sha
+                if not self._refreshing:
+                    break
+                if self._sha is not None and not fresh:
+                    self.hits += 1
+                    return self._value, self._sha
+                self._cond.wait()
+            self._refreshing = True
+            generation = self._generation
+            etag = self._etag if self._sha is not None else None
+            sha = self._sha
+
+        done = False
+        try:
+            not_modified, content, new_sha, new_etag = self.github_service.get_file_if_modified(
+                self.path, etag
+            )
+            value = None
+            if content is not None and new_sha != sha:
+                with timed('parse'):
+                    value = self.parse(content)
+            done = True
+        finally:
+            with self._cond:
+                self._refreshing = False
+                self._cond.notify_all()
+                # 재검증 도중 invalidate()/put()됐다면 이 결과는 쓰기 이전 것일 수 있어 버림
+                if done and generation == self._generation:
+                    if not not_modified and content is None:
+                        # 조회 실패 시 남아있는 값이 있으면 그대로 사용
+                        self.errors += 1
+                    else:
+                        if value is None:
+                            self.revalidations += 1
+                        else:
+                            self.misses += 1
+                            self._value, self._sha = value, new_sha
+                        if not not_modified:
+                            self._etag = new_etag
+                        self._checked_at = now
+                result = self._value, self._sha
+        return result
+
+    @property
+    def sha(self):
+        """지금 캐시된 SHA"""
+        with self._cond:
+            return self._sha
+
+    def put(self, value, sha):
+        """자체 커밋한 값과 새 SHA를 캐시 (다시 내려받아 파싱하지 않음)
+
+        contents API의 ETag는 알 수 없으므로 TTL 뒤 첫 재검증은 전체 조회가 되지만,
+        SHA가 같으면 다시 파싱하지 않는다.
+        """
+        with self._cond:
+            self._value, self._sha = value, sha
+            self._etag = None
+            self._checked_at = time.monotonic()
+            self._generation += 1
+
+    def invalidate(self):
+        """다음 조회 시 반드시 재검증하도록 표시 (자체 쓰기 후 호출)"""
+        with self._cond:
+            self._checked_at = 0.0
+            self._generation += 1
+
+    def stats(self):
+        """캐시 적중/실패 카운터"""
+        with self._cond:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'revalidations': self.revalidations,
+                'errors': self.errors,
+                'sha': self._sha,
+                'ttl': self.ttl,
+            }
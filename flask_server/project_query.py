@@ -0,0 +1,195 @@
+import base64
+import json
+import threading
+from bisect import bisect_left, bisect_right
+from project_records import PROJECT_FIELDS
+
+FILTER_FIELDS = ['status', 'category', 'subCategory', 'manager', 'supervisor']
+SORT_FIELDS = FILTER_FIELDS + ['id', 'name', 'start_date', 'end_date', 'created_at', 'updated_at']
+# 쿼리 파라미터 -> (날짜 열, 하한 여부)
+DATE_RANGE_PARAMS = {
+    'start_from': ('start_date', True),
+    'start_to': ('start_date', False),
+    'end_from': ('end_date', True),
+    'end_to': ('end_date', False),
+}
+DEFAULT_LIMIT = 100
+MAX_LIMIT = 1000
+
+
+def _text(value):
+    return '' if value is None else str(value)
+
+
+class ProjectQuery:
+    """GET /api/projects 쿼리 파라미터를 검증해 담아두는 객체"""
+
+    def __init__(self, args):
+        self.filters = {}
+        for field in FILTER_FIELDS:
+            if args.get(field):
+                self.filters[field] = set(args[field].split(','))
+
+        self.date_ranges = {}
+        for param, (field, is_lower) in DATE_RANGE_PARAMS.items():
+            if args.get(param):
+                lower, upper = self.date_ranges.get(field, (None, None))
+                if is_lower:
+                    lower = args[param]
+                else:
+                    upper = args[param]
+                self.date_ranges[field] = (lower, upper)
+
+        self.fields = None
+        if args.get('fields'):
+            self.fields = args['fields'].split(',')
+            unknown = [field for field in self.fields if field not in PROJECT_FIELDS]
+            if unknown:
+                raise ValueError(f'unknown fields: {", ".join(unknown)}')
+
+        self.limit = None
+        if args.get('limit') or args.get('cursor'):
+            try:
+                self.limit = int(args.get('limit', DEFAULT_LIMIT))
+            except ValueError:
+                raise ValueError('limit must be an integer')
+            if not 1 <= self.limit <= MAX_LIMIT:
+                raise ValueError(f'limit must be between 1 and {MAX_LIMIT}')
+
+        # 페이지 단위 조회는 커서가 안정적이도록 정렬 기준을 항상 둔다
+        sort = args.get('sort') or ('id' if self.limit else None)
+        self.descending = False
+        self.sort = None
+        if sort:
+            self.descending = sort.startswith('-')
+            self.sort = sort.lstrip('-')
+            if self.sort not in SORT_FIELDS:
+                raise ValueError(f'cannot sort by {self.sort}')
+
+        self.cursor = None
+        if args.get('cursor'):
+            self.cursor = decode_cursor(args['cursor'])
+
+
+def encode_cursor(project, sort):
+    """마지막 항목의 (정렬 값, id)를 불투명한 커서 문자열로 인코딩"""
+    key = [_text(project.get(sort)), _text(project.get('id'))]
+    return base64.urlsafe_b64encode(json.dumps(key).encode()).decode()
+
+def decode_cursor(cursor):
+    try:
+        value, project_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return str(value), str(project_id)
+    except (ValueError, TypeError):
+        raise ValueError('invalid cursor')
+
+
+class ProjectIndex:
+    """스냅샷 하나에 대한 보조 인덱스
+
+    필터 열은 값 -> 위치 목록, 날짜/정렬 열은 (값, id) 정렬 목록을 가진다.
+    정렬 목록은 처음 요청될 때 만들고 같은 버전 동안 재사용한다.
+    """
+
+    def __init__(self, version, projects):
+        self.version = version
+        self.projects = projects
+        self.by_value = {}
+        for field in FILTER_FIELDS:
+            index = {}
+            for pos, project in enumerate(projects):
+                index.setdefault(_text(project.get(field)), []).append(pos)
+            self.by_value[field] = index
+        self._sorted = {}
+        self._lock = threading.Lock()
+
+    def sorted_keys(self, field):
+        """field 기준 ((값, id) 목록, 위치 목록)을 반환"""
+        with self._lock:
+            if field not in self._sorted:
+                order = sorted(
+                    range(len(self.projects)),
+                    key=lambda pos: (_text(self.projects[pos].get(field)),
+                                     _text(self.projects[pos].get('id')))
+                )
+                keys = [(_text(self.projects[pos].get(field)),
+                         _text(self.projects[pos].get('id'))) for pos in order]
+                self._sorted[field] = (keys, order)
+            return self._sorted[field]
+
+    def _candidates(self, query):
+        """필터 조건을 만족하는 위치 집합 (조건이 없으면 None)"""
+        sets = []
+        for field, values in query.filters.items():
+            positions = set()
+            for value in values:
+                positions.update(self.by_value[field].get(value, ()))
+            sets.append(positions)
+
+        for field, (lower, upper) in query.date_ranges.items():
+            keys, order = self.sorted_keys(field)
+            # 빈 날짜는 범위 조건에서 제외
+            start = bisect_left(keys, (lower or '\x00',))
+            end = len(keys) if upper is None else bisect_right(keys, (upper + '\uffff',))
+            sets.append(set(order[start:end]))
+
+        if not sets:
+            return None
+        sets.sort(key=len)
+        result = sets[0]
+        for other in sets[1:]:
+            result = result & other
+        return result
+
+    def search(self, query):
+        """조건에 맞는 프로젝트 목록과 다음 페이지 커서를 반환"""
+        candidates = self._candidates(query)
+
+        if query.sort is None:
+            if candidates is None:
+                positions = range(len(self.projects))
+            else:
+                positions = sorted(candidates)
+        else:
+            keys, order = self.sorted_keys(query.sort)
+            if query.descending:
+                start = len(order)
+                if query.cursor is not None:
+                    start = bisect_left(keys, query.cursor)
+                positions = (order[i] for i in range(start - 1, -1, -1))
+            else:
+                start = 0
+                if query.cursor is not None:
+                    start = bisect_right(keys, query.cursor)
+                positions = (order[i] for i in range(start, len(order)))
+            if candidates is not None:
+                positions = (pos for pos in positions if pos in candidates)
+
+        results = []
+        next_cursor = None
+        for pos in positions:
+            if query.limit is not None and len(results) == query.limit:
+                next_cursor = encode_cursor(results[-1], query.sort)
+                break
+            results.append(self.projects[pos])
+
+        if query.fields is not None:
+            results = [{field: project.get(field) for field in query.fields}
+                       for project in results]
+        return results, next_cursor
+
+
+class ProjectIndexCache:
+    """저장소 스냅샷 버전이 바뀔 때만 ProjectIndex를 다시 만듦"""
+
+    def __init__(self, store):
+        self.store = store
+        self._index = None
+        self._lock = threading.Lock()
+
+    def get(self):
+        version, projects = self.store.snapshot()
+        with self._lock:
+            if self._index is None or self._index.version != version or version is None:
+                self._index = ProjectIndex(version, projects)
+            return self._index
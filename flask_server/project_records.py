@@ -0,0 +1,156 @@
+import csv
+import io
+from operator import attrgetter
+
+PROJECT_FIELDS = [
+    'id', 'name', 'category', 'subCategory', 'description', 'detail',
+    'procedure', 'start_date', 'end_date', 'status', 'manager', 'supervisor',
+    'created_at', 'updated_at', 'update_notes',
+]
+_FIELD_SET = frozenset(PROJECT_FIELDS)
+
+
+def _text(value):
+    return '' if value is None else str(value)
+
+
+class ProjectRecord:
+    """프로젝트 한 행 (스키마 밖의 열은 extra에 보관)
+
+    레코드는 여러 스냅샷이 공유하므로 제자리에서 고치지 않고 replace()로 새로 만든다.
+    """
+    __slots__ = tuple(PROJECT_FIELDS) + ('extra',)
+
+    def __init__(self, data):
+        extra = None
+        for field in PROJECT_FIELDS:
+            setattr(self, field, _text(data.get(field)))
+        for key, value in data.items():
+            if key not in _FIELD_SET:
+                if extra is None:
+                    extra = {}
+                extra[key] = _text(value)
+        self.extra = extra
+
+    @classmethod
+    def from_values(cls, columns, values, missing):
+        """스키마 열만 있는 CSV 행에서 바로 만듦 (파싱 빠른 경로)"""
+        record = cls.__new__(cls)
+        for field, value in zip(columns, values):
+            setattr(record, field, value)
+        for field in missing:
+            setattr(record, field, '')
+        record.extra = None
+        return record
+
+    def get(self, field):
+        if field in _FIELD_SET:
+            return getattr(self, field)
+        if self.extra is not None:
+            return self.extra.get(field, '')
+        return ''
+
+    def replace(self, data):
+        """data의 값으로 바꾼 새 레코드"""
+        merged = self.to_dict()
+        merged.update(data)
+        return ProjectRecord(merged)
+
+    def to_dict(self):
+        result = {field: getattr(self, field) for field in PROJECT_FIELDS}
+        if self.extra:
+            result.update(self.extra)
+        return result
+
+
+class ProjectTable:
+    """CSV 파일 하나에 해당하는 레코드 모음
+
+    id를 키로 하는 dict(삽입 순서 유지)에 담아 조회/수정/삭제가 O(1)이다.
+    id가 중복되거나 비어 있는 행은 내부 키로 보관해 저장할 때 잃지 않는다.
+    """
+
+    def __init__(self, columns=None, rows=None):
+        self.columns = list(columns or PROJECT_FIELDS)
+        self.rows = rows if rows is not None else {}
+
+    @classmethod
+    def parse(cls, content):
+        """CSV 문자열을 파싱"""
+        reader = csv.reader(io.StringIO(content))
+        header = next(reader, None)
+        table = cls(header or PROJECT_FIELDS)
+        columns = table.columns
+        width = len(columns)
+        fast = len(set(columns)) == width and all(column in _FIELD_SET for column in columns)
+        missing = [field for field in PROJECT_FIELDS if field not in columns]
+        for values in reader:
+            if not values:
+                continue
+            if fast and len(values) == width:
+                record = ProjectRecord.from_values(columns, values, missing)
+            else:
+                record = ProjectRecord(dict(zip(columns, values)))
+            table._insert(record)
+        return table
+
+    def to_csv(self):
+        """CSV 문자열로 직렬화"""
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator='\n')
+        writer.writerow(self.columns)
+        if len(self.columns) > 1 and all(column in _FIELD_SET for column in self.columns):
+            row = attrgetter(*self.columns)
+            writer.writerows(row(record) for record in self.rows.values())
+        else:
+            for record in self.rows.values():
+                writer.writerow([record.get(column) for column in self.columns])
+        return buffer.getvalue()
+
+    def copy(self):
+        """레코드는 공유하고 목록만 복사 (레코드는 불변으로 다룸)"""
+        return ProjectTable(self.columns, dict(self.rows))
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __contains__(self, project_id):
+        return project_id in self.rows
+
+    def get(self, project_id):
+        return self.rows.get(project_id)
+
+    def records(self):
+        return self.rows.values()
+
+    def _insert(self, record):
+        key = record.id
+        if not key or key in self.rows:
+            key = f"{record.id}\0{len(self.rows)}"
+            while key in self.rows:
+                key += '\0'
+        self.rows[key] = record
+        return record
+
+    def _add_columns(self, data):
+        for key in data:
+            if key not in self.columns:
+                self.columns.append(key)
+
+    def add(self, data):
+        """새 레코드를 추가하고 반환"""
+        self._add_columns(data)
+        return self._insert(ProjectRecord(data))
+
+    def update(self, project_id, data):
+        """(이전, 이후) 레코드를 반환 (없으면 KeyError)"""
+        old = self.rows[project_id]
+        self._add_columns(data)
+        new = old.replace(data)
+        new.id = old.id
+        self.rows[project_id] = new
+        return old, new
+
+    def delete(self, project_id):
+        """삭제한 레코드를 반환 (없으면 KeyError)"""
+        return self.rows.pop(project_id)
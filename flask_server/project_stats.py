@@ -0,0 +1,116 @@
+import threading
+from collections import Counter
+from datetime import date
+
+# 앱 대시보드(dashboard_screen.dart)와 같이 보류도 닫힌 업무로 본다
+DONE_STATUSES = {'완료', '보류'}
+BUCKETS = ['day', 'week', 'month', 'year']
+DATE_FIELDS = ['start_date', 'end_date']
+
+
+def _day(value):
+    """'2025-01-31', '2025-01-31T09:00:00' 등에서 날짜 부분만"""
+    value = '' if value is None else str(value).strip()
+    return value[:10] if len(value) >= 10 else ''
+
+def _bucket(day, bucket):
+    if bucket == 'day':
+        return day
+    if bucket == 'month':
+        return day[:7]
+    if bucket == 'year':
+        return day[:4]
+    try:
+        year, week, _ = date.fromisoformat(day).isocalendar()
+    except ValueError:
+        return None
+    return f"{year}-W{week:02d}"
+
+
+class ProjectStats:
+    """대시보드 집계를 카운터로 유지하는 저장소 관찰자
+
+    최초 로드(reset)에서만 전체를 훑고, 이후에는 변경마다 이전 값을 빼고 새 값을 더한다.
+    날짜별 카운터는 날짜 수에 비례해 버킷으로 묶으므로 프로젝트 수와 무관하다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._clear()
+
+    def _clear(self):
+        self.total = 0
+        self.by_status = Counter()
+        self.by_category = Counter()
+        self.by_subcategory = Counter()
+        self.by_manager = Counter()
+        self.by_day = {field: Counter() for field in DATE_FIELDS}
+        # 닫히지 않은 프로젝트의 (종료일, 담당자) -> 개수, 지연 집계용
+        self.open_by_end = Counter()
+
+    def _count(self, project, sign):
+        get = project.get
+        self.total += sign
+        self.by_status[get('status') or ''] += sign
+        self.by_category[get('category') or ''] += sign
+        self.by_subcategory[(get('category') or '', get('subCategory') or '')] += sign
+        self.by_manager[get('manager') or ''] += sign
+        for field in DATE_FIELDS:
+            day = _day(get(field))
+            if day:
+                self.by_day[field][day] += sign
+        end_day = _day(get('end_date'))
+        if end_day and get('status') not in DONE_STATUSES:
+            self.open_by_end[(end_day, get('manager') or '')] += sign
+
+    def reset(self, projects, version=None):
+        with self._lock:
+            self._clear()
+            for project in projects:
+                self._count(project, 1)
+
+    def apply(self, old, new):
+        with self._lock:
+            if old is not None:
+                self._count(old, -1)
+            if new is not None:
+                self._count(new, 1)
+
+    def summary(self, bucket='month', today=None):
+        """집계 결과를 JSON으로 보낼 dict로 반환"""
+        if bucket not in BUCKETS:
+            raise ValueError(f'bucket must be one of {", ".join(BUCKETS)}')
+        today = (today or date.today()).isoformat()
+
+        def positive(counter):
+            return {key: count for key, count in counter.items() if count > 0}
+
+        with self._lock:
+            by_subcategory = {}
+            for (category, sub), count in self.by_subcategory.items():
+                if count > 0:
+                    by_subcategory.setdefault(category, {})[sub] = count
+
+            timeline = {}
+            for field in DATE_FIELDS:
+                buckets = Counter()
+                for day, count in self.by_day[field].items():
+                    key = _bucket(day, bucket)
+                    if key is not None and count > 0:
+                        buckets[key] += count
+                timeline[field] = dict(sorted(buckets.items()))
+
+            overdue = Counter()
+            for (end_day, manager), count in self.open_by_end.items():
+                if end_day < today and count > 0:
+                    overdue[manager] += count
+
+            return {
+                'total': self.total,
+                'by_status': positive(self.by_status),
+                'by_category': positive(self.by_category),
+                'by_subCategory': by_subcategory,
+                'by_manager': positive(self.by_manager),
+                'timeline': timeline,
+                'overdue': {'total': sum(overdue.values()), 'by_manager': dict(overdue)},
+            }
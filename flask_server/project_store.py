@@ -0,0 +1,211 @@
+import os
+import threading
+import uuid
+from commit_queue import CommitQueue, DuplicateProjectError
+from project_cache import ProjectCache
+from project_records import ProjectTable
+
+
+def apply_operation(table, operation):
+    """대기 중인 변경 하나를 ProjectTable에 적용하고 (이전, 이후) dict 목록을 반환
+
+    대상이 없으면 KeyError, 추가할 id가 이미 있으면 DuplicateProjectError.
+    실패하면 table은 바뀌지 않는다.
+    """
+    if operation.kind == 'import':
+        ids = [project.get('id') for project in operation.projects]
+        if len(set(ids)) != len(ids) or any(project_id in table for project_id in ids):
+            raise DuplicateProjectError('duplicate id in import')
+        return [(None, table.add(project).to_dict()) for project in operation.projects]
+    if operation.kind == 'add':
+        if not operation.project.get('id'):
+            operation.project['id'] = uuid.uuid4().hex
+        operation.project_id = operation.project['id']
+        if operation.project_id in table:
+            raise DuplicateProjectError(operation.project_id)
+        return [(None, table.add(operation.project).to_dict())]
+    if operation.kind == 'update':
+        old, new = table.update(operation.project_id, operation.project)
+        return [(old.to_dict(), new.to_dict())]
+    return [(table.delete(operation.project_id).to_dict(), None)]
+
+
+class ProjectStore:
+    """프로젝트 저장소 인터페이스
+
+    쓰기는 모두 submit()으로 들어오고 PendingWrite를 반환한다.
+    동기 저장소는 이미 완료된 PendingWrite를 돌려준다.
+    관찰자(observer)는 reset(projects, version)과 apply(old, new)를 구현하며,
+    전체를 다시 읽을 때와 변경이 반영될 때마다 호출된다.
+    version은 워커와 무관하게 같은 데이터를 가리키는 값이며, 없으면 None이다.
+    mark(version)을 구현한 관찰자는 자체 쓰기로 바뀐 버전도 받는다.
+    """
+
+    def __init__(self):
+        self.observers = []
+
+    def add_observer(self, observer):
+        self.observers.append(observer)
+
+    def notify_reset(self, projects, version=None):
+        for observer in self.observers:
+            observer.reset(projects, version)
+
+    def notify_change(self, old, new):
+        for observer in self.observers:
+            observer.apply(old, new)
+
+    def notify_version(self, version):
+        for observer in self.observers:
+            if hasattr(observer, 'mark'):
+                observer.mark(version)
+
+    def list_projects(self):
+        """전체 프로젝트를 dict 목록으로 반환"""
+        raise NotImplementedError
+
+    def get_project(self, project_id):
+        """프로젝트 하나를 dict로 반환 (없으면 None)"""
+        raise NotImplementedError
+
+    def existing_ids(self, ids):
+        """ids 중 이미 저장된 id의 집합"""
+        _, projects = self.snapshot()
+        stored = {str(project.get('id')) for project in projects}
+        return {project_id for project_id in ids if project_id in stored}
+
+    def snapshot(self):
+        """(버전, 전체 프로젝트 목록)을 반환
+
+        버전은 데이터가 바뀔 때만 달라지므로 파생 인덱스의 캐시 키로 쓴다.
+        반환된 목록은 읽기 전용으로 다룬다.
+        """
+        raise NotImplementedError
+
+    def submit(self, operation):
+        """ProjectOperation을 적용하고 PendingWrite를 반환"""
+        raise NotImplementedError
+
+    def get_write(self, token):
+        """토큰으로 아직 추적 중인 PendingWrite를 조회"""
+        return None
+
+    def stats(self):
+        """저장소 캐시/큐 상태"""
+        return {}
+
+
+class GitHubCSVStore(ProjectStore):
+    """GitHub의 CSV 파일 하나에 전체 프로젝트를 저장하는 기본 저장소"""
+
+    def __init__(self, github_service, path):
+        super().__init__()
+        self.cache = ProjectCache(github_service, path, ProjectTable.parse)
+        self._records = (None, [])
+        self._known_sha = None
+        self._sync_lock = threading.Lock()
+        self.queue = CommitQueue(
+            github_service, path, self.load, self._apply,
+            ProjectTable.to_csv, self.cache.invalidate,
+            on_commit=self._on_commit, commit_lock=self._sync_lock
+        )
+
+    def _records_for(self, table, sha):
+        # SHA가 같으면 dict 변환 결과를 재사용
+        records = self._records
+        if records[0] != sha:
+            records = (sha, [record.to_dict() for record in table.records()])
+            self._records = records
+        return records
+
+    def _sync(self, table, sha):
+        """관찰자가 모르는 SHA(외부 수정, 최초 로드)를 보면 전체를 다시 알림
+
+        커밋 중에는 큐가 _sync_lock을 쥐고 있으므로, 방금 커밋된 SHA를 먼저 본 읽기는
+        _on_commit이 그 SHA를 기록할 때까지 기다렸다가 외부 수정으로 오인하지 않는다.
+        반대로 커밋 전에 캐시에서 꺼낸 이전 SHA는 캐시가 이미 새 SHA를 갖고 있으므로 무시한다.
+        """
+        if sha == self._known_sha:
+            return
+        with self._sync_lock:
+            if sha != self._known_sha and sha == self.cache.sha:
+                self._known_sha = sha
+                self.notify_reset(self._records_for(table, sha)[1], sha)
+
+    def _apply(self, table, operation):
+        """변경을 적용하면서 관찰자에게 넘길 (이전, 이후) 상태를 기록"""
+        operation.changes = apply_operation(table, operation)
+        return table
+
+    def _on_commit(self, applied, sha, table):
+        # 큐가 commit_lock(_sync_lock)을 쥔 상태에서 호출됨
+        self.cache.put(table, sha)
+        for pending in applied:
+            for old, new in pending.operation.changes:
+                self.notify_change(old, new)
+        self._known_sha = sha
+        self.notify_version(sha)
+
+    def load(self):
+        """캐시된 ProjectTable의 복사본과 SHA를 반환 (자체 쓰기 이후의 최신 내용)"""
+        table, sha = self.cache.get(fresh=True)
+        if table is not None:
+            self._sync(table, sha)
+            return table.copy(), sha
+        return ProjectTable(), None
+
+    def list_projects(self):
+        return list(self.snapshot()[1])
+
+    def snapshot(self):
+        table, sha = self.cache.get()
+        if table is None:
+            return None, []
+        self._sync(table, sha)
+        return self._records_for(table, sha)
+
+    def get_project(self, project_id):
+        table, _ = self.cache.get()
+        record = table.get(project_id) if table is not None else None
+        return record.to_dict() if record is not None else None
+
+    def existing_ids(self, ids):
+        table, _ = self.cache.get()
+        if table is None:
+            return set()
+        return {project_id for project_id in ids if project_id in table}
+
+    def submit(self, operation):
+        return self.queue.submit(operation)
+
+    def get_write(self, token):
+        return self.queue.get(token)
+
+    def stats(self):
+        return {'cache': self.cache.stats()}
+
+
+def database_uri():
+    """DATABASE_URL 또는 DB_* 환경 변수로 SQLAlchemy URI를 구성"""
+    if os.getenv('DATABASE_URL'):
+        return os.getenv('DATABASE_URL')
+    if os.getenv('DB_HOST'):
+        return (
+            f"postgresql://{os.getenv('DB_USER')}:{os.getenv('DB_PASSWORD')}"
+            f"@{os.getenv('DB_HOST')}:{os.getenv('DB_PORT', '5432')}/{os.getenv('DB_NAME')}"
+        )
+    return 'sqlite:///task_master.db'
+
+def create_project_store(github_service, path):
+    """PROJECT_STORE 설정(github | sql)에 맞는 저장소를 생성"""
+    backend = os.getenv('PROJECT_STORE', 'github').lower()
+    if backend == 'github':
+        return GitHubCSVStore(github_service, path)
+    if backend == 'sql':
+        mirror = None
+        if os.getenv('PROJECT_STORE_MIRROR', 'false').lower() == 'true':
+            mirror = GitHubCSVStore(github_service, path)
+        # SQLAlchemy는 SQL 저장소를 쓸 때만 불러와 기본 설정의 워커 시작을 가볍게 유지
+        from sql_store import SQLProjectStore
+        return SQLProjectStore(mirror)
+    raise ValueError(f"Unknown PROJECT_STORE: {backend}")
@@ -0,0 +1,135 @@
+import os
+import threading
+import time
+import uuid
+from sqlalchemy.exc import IntegrityError
+from commit_queue import PendingWrite
+from models import db, Project
+from project_records import PROJECT_FIELDS
+from project_store import ProjectStore
+
+
+class SQLProjectStore(ProjectStore):
+    """SQLAlchemy(SQLite/PostgreSQL) 저장소
+
+    id는 기본 키로, status/category/manager는 인덱스로 조회한다.
+    mirror가 주어지면 변경을 GitHub CSV로 비동기 복제한다.
+    """
+
+    def __init__(self, mirror=None, ttl=None):
+        super().__init__()
+        self.mirror = mirror
+        if ttl is None:
+            ttl = float(os.getenv('PROJECT_CACHE_TTL', '10'))
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._version = 0
+        self._snapshot = None
+        self._loaded_at = 0.0
+        self._previous = None
+
+    def list_projects(self):
+        return [p.to_dict() for p in db.session.execute(db.select(Project)).scalars()]
+
+    def snapshot(self):
+        # 다른 워커의 쓰기는 TTL 안에 반영되고, 자체 쓰기는 즉시 반영된다.
+        # 버전은 내용이 바뀐 경우에만 올려 파생 인덱스를 다시 만들지 않게 한다
+        with self._lock:
+            now = time.monotonic()
+            if self._snapshot is None or now - self._loaded_at >= self.ttl:
+                projects = self.list_projects()
+                if self._sync(projects) or self._snapshot is None:
+                    self._version += 1
+                    self._snapshot = (self._version, projects)
+                self._loaded_at = now
+            return self._snapshot
+
+    def _sync(self, projects):
+        """직전 상태와 비교해 다른 워커가 만든 변경을 관찰자에게 알리고, 바뀐 것이 있으면 True"""
+        current = {p['id']: p for p in projects}
+        changed = False
+        if self._previous is None:
+            self.notify_reset(projects)
+            changed = True
+        else:
+            for project_id, project in current.items():
+                old = self._previous.get(project_id)
+                if old != project:
+                    self.notify_change(old, project)
+                    changed = True
+            for project_id, old in self._previous.items():
+                if project_id not in current:
+                    self.notify_change(old, None)
+                    changed = True
+        self._previous = current
+        return changed
+
+    def get_project(self, project_id):
+        project = db.session.get(Project, project_id)
+        return project.to_dict() if project else None
+
+    def existing_ids(self, ids):
+        query = db.select(Project.id).where(Project.id.in_(ids))
+        return set(db.session.execute(query).scalars())
+
+    def _new_project(self, data):
+        if not data.get('id'):
+            data['id'] = uuid.uuid4().hex
+        project = Project(id=data['id'])
+        # 모든 열을 채워 두면 커밋 전에 to_dict()로 저장될 값을 그대로 얻는다
+        project.update_from({field: data.get(field, '') for field in PROJECT_FIELDS})
+        db.session.add(project)
+        return project
+
+    def submit(self, operation):
+        pending = PendingWrite(operation)
+        if operation.kind == 'import':
+            # 전체 행을 하나의 트랜잭션으로 추가
+            projects = [self._new_project(data) for data in operation.projects]
+            olds = [None] * len(projects)
+        elif operation.kind == 'add':
+            project = self._new_project(operation.project)
+            operation.project_id = project.id
+            projects, olds = [project], [None]
+        else:
+            project = db.session.get(Project, operation.project_id)
+            if project is None:
+                pending.finish('failed', 'not_found')
+                return pending
+            projects, olds = [project], [project.to_dict()]
+            if operation.kind == 'update':
+                project.update_from(operation.project)
+            else:
+                db.session.delete(project)
+
+        # 커밋하면 객체가 만료되어 to_dict()가 행마다 SELECT를 하므로 커밋 전에 만든다
+        if operation.kind == 'delete':
+            changes = [(olds[0], None)]
+        else:
+            changes = [(old, project.to_dict()) for old, project in zip(olds, projects)]
+        try:
+            db.session.commit()
+        except IntegrityError:
+            db.session.rollback()
+            pending.finish('failed', 'duplicate')
+            return pending
+
+        operation.changes = changes
+        with self._lock:
+            self._snapshot = None
+            if self._previous is not None:
+                for old, new in operation.changes:
+                    if new is None:
+                        self._previous.pop(old['id'], None)
+                    else:
+                        self._previous[new['id']] = new
+                    self.notify_change(old, new)
+        pending.finish('committed')
+        if self.mirror is not None:
+            self.mirror.submit(operation)
+        return pending
+
+    def stats(self):
+        if self.mirror is None:
+            return {}
+        return self.mirror.stats()
@@ -0,0 +1,58 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fake_github import FakeGitHub
+from github_service import GitHubService
+from project_records import PROJECT_FIELDS
+
+CSV_PATH = 'assets/project_list.csv'
+
+
+def make_csv(rows):
+    lines = [','.join(PROJECT_FIELDS)]
+    for i in range(rows):
+        project = {field: f'{field}-{i}' for field in PROJECT_FIELDS}
+        project.update(id=f'p{i}', status='진행중', end_date='2025-01-31')
+        lines.append(','.join(project[field] for field in PROJECT_FIELDS))
+    return '\n'.join(lines) + '\n'
+
+
+@pytest.fixture
+def fake():
+    fake = FakeGitHub()
+    fake.url = fake.start()
+    yield fake
+    fake.stop()
+
+@pytest.fixture
+def github(fake, monkeypatch):
+    monkeypatch.setenv('GITHUB_API_URL', fake.url)
+    monkeypatch.setenv('GITHUB_TOKEN', 'test')
+    monkeypatch.setenv('GITHUB_TIMEOUT', '5')
+    monkeypatch.setenv('GITHUB_BACKOFF_BASE', '0.001')
+    monkeypatch.setenv('GITHUB_BACKOFF_MAX', '0.01')
+    return GitHubService()
+
+@pytest.fixture
+def store(fake, github, monkeypatch):
+    from project_store import GitHubCSVStore
+    monkeypatch.setenv('COMMIT_WINDOW_SECONDS', '0')
+    monkeypatch.setenv('PROJECT_CACHE_TTL', '60')
+    fake.put_file(CSV_PATH, make_csv(3))
+    return GitHubCSVStore(github, CSV_PATH)
+
+@pytest.fixture
+def sql_app():
+    from flask import Flask
+    from models import db
+    app = Flask(__name__)
+    app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite://'
+    db.init_app(app)
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.session.remove()
@@ -0,0 +1,29 @@
+import io
+from datetime import datetime
+
+import openpyxl
+
+from bulk_io import iter_upload_rows, read_projects
+
+
+def test_excel_upload_with_korean_headers():
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.append(['구분', '분류', '상세', '담당', 'start_date'])
+    sheet.append(['인사', '채용', '면접 일정 조율', '김담당', datetime(2025, 1, 31)])
+    stream = io.BytesIO()
+    workbook.save(stream)
+    stream.seek(0)
+
+    projects, errors = read_projects(iter_upload_rows('업무.xlsx', stream), lambda ids: set())
+    assert errors == []
+    [project] = projects
+    assert (project['category'], project['subCategory'], project['manager']) == ('인사', '채용', '김담당')
+    assert project['name'] == '면접 일정 조율'
+    assert project['start_date'].startswith('2025-01-31')
+
+def test_cp949_csv_upload():
+    content = '구분,상세\n총무,비품 구매\n'.encode('cp949')
+    projects, errors = read_projects(iter_upload_rows('업무.csv', io.BytesIO(content)), lambda ids: set())
+    assert errors == []
+    assert [(p['category'], p['name']) for p in projects] == [('총무', '비품 구매')]
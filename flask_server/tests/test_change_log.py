@@ -0,0 +1,48 @@
+from change_log import ChangeLog
+
+P1 = {'id': 'p1', 'name': 'a'}
+P1_NEW = {'id': 'p1', 'name': 'b'}
+
+
+def test_versioned_cursor_is_shared_between_workers():
+    # 워커 A가 W -> Y로 커밋하고, 워커 B는 W에서 멈춰 있고, 워커 C는 Y에서 시작
+    a, b, c = ChangeLog(), ChangeLog(), ChangeLog()
+    a.reset([P1], 'W')
+    b.reset([P1], 'W')
+    a.apply(P1, P1_NEW)
+    a.mark('Y')
+    c.reset([P1_NEW], 'Y')
+
+    assert a.cursor() == c.cursor() == 'Y.0'
+    assert a.changes_since(b.cursor()) == ([P1_NEW], [], 'Y.0')
+    assert c.changes_since(a.cursor()) == ([], [], 'Y.0')
+    # B는 Y를 본 적이 없으므로 전체 스냅샷
+    assert b.changes_since(a.cursor()) is None
+
+def test_content_revert_uses_latest_position():
+    log = ChangeLog()
+    log.reset([P1], 'W')
+    log.apply(P1, P1_NEW)
+    log.mark('Y')
+    log.apply(P1_NEW, P1)
+    log.mark('W')
+    assert log.changes_since('W.0') == ([], [], 'W.0')
+    assert log.changes_since('Y.0') == ([P1], [], 'W.0')
+
+def test_unversioned_cursor_is_local_to_the_worker():
+    a, b = ChangeLog(), ChangeLog()
+    a.reset([P1])
+    b.reset([P1])
+    cursor = a.cursor()
+    a.apply(P1, P1_NEW)
+    assert a.changes_since(cursor) == ([P1_NEW], [], a.cursor())
+    assert b.changes_since(cursor) is None
+
+def test_evicted_versions_need_a_full_snapshot():
+    log = ChangeLog(max_entries=2)
+    log.reset([P1], 'W')
+    for i, version in enumerate(['X', 'Y', 'Z']):
+        log.apply(P1, {'id': 'p1', 'name': str(i)})
+        log.mark(version)
+    assert log.changes_since('W.0') is None
+    assert log.changes_since('X.0') == ([{'id': 'p1', 'name': '2'}], [], 'Z.0')
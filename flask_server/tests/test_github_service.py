@@ -0,0 +1,63 @@
+import pytest
+
+from conftest import CSV_PATH, make_csv
+
+PATH = 'assets/data.csv'
+
+
+@pytest.fixture
+def seeded(fake):
+    fake.put_file(PATH, 'id,name\np1,a\n')
+    return fake
+
+
+def test_get_retries_server_errors(seeded, github):
+    seeded.fail_next(2, 502)
+    content, sha = github.get_file_content(PATH)
+    assert content == 'id,name\np1,a\n'
+    assert github.stats()['retries'] == 2
+
+@pytest.mark.parametrize('status', [403, 429])
+def test_rate_limit_with_retry_after_is_retried(seeded, github, status):
+    seeded.fail_next(1, status, {'Retry-After': '0'})
+    content, _ = github.get_file_content(PATH)
+    assert content is not None
+    assert github.stats()['retries'] == 1
+
+def test_put_is_retried_after_rate_limit(seeded, github):
+    _, sha = github.get_file_content(PATH)
+    seeded.fail_next(1, 429, {'Retry-After': '0'})
+    status, new_sha = github.commit_file(PATH, 'id,name\np1,b\n', 'update', sha)
+    assert status == 200
+    assert seeded.read_file(PATH) == 'id,name\np1,b\n'
+
+def test_put_is_not_retried_on_server_error(seeded, github):
+    _, sha = github.get_file_content(PATH)
+    requests_before = seeded.requests
+    seeded.fail_next(1, 502)
+    assert github.commit_file(PATH, 'id,name\np1,b\n', 'update', sha) == (502, None)
+    assert seeded.requests == requests_before + 1
+    assert seeded.read_file(PATH) == 'id,name\np1,a\n'
+
+def test_not_modified_does_not_use_quota(seeded, github):
+    not_modified, content, sha, etag = github.get_file_if_modified(PATH)
+    assert not not_modified and content is not None
+    remaining = seeded.remaining
+    assert github.get_file_if_modified(PATH, etag) == (True, None, None, etag)
+    assert seeded.remaining == remaining
+    assert github.stats()['rate_limit_remaining'] == remaining
+
+def test_large_files_use_git_data_api(fake, github):
+    fake.contents_limit = 100
+    github.large_file_threshold = 100
+    fake.put_file(CSV_PATH, make_csv(2))
+    content, sha = github.get_file_content(CSV_PATH)
+    assert content == make_csv(2)
+
+    status, new_sha = github.commit_file(CSV_PATH, make_csv(5), 'grow', sha)
+    assert status == 201
+    assert fake.read_file(CSV_PATH) == make_csv(5)
+    assert github.get_file_content(CSV_PATH) == (make_csv(5), new_sha)
+    # 이미 바뀐 파일의 이전 SHA로는 커밋할 수 없음
+    assert github.commit_file(CSV_PATH, make_csv(6), 'stale', sha) == (409, None)
+    assert fake.read_file(CSV_PATH) == make_csv(5)
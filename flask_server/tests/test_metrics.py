@@ -0,0 +1,28 @@
+from metrics import Counter, Histogram
+
+
+def test_mixed_label_value_types_render():
+    counter = Counter('calls_total', 'calls', labels=('status',))
+    counter.inc(status=200)
+    counter.inc(status='error')
+    counter.inc(status='200')
+    assert counter.render()[2:] == ['calls_total{status="200"} 2', 'calls_total{status="error"} 1']
+
+    histogram = Histogram('latency_seconds', 'latency', labels=('status',), buckets=(0.1,))
+    histogram.observe(0.05, status=200)
+    histogram.observe(0.5, status='error')
+    lines = histogram.render()
+    assert 'latency_seconds_bucket{status="200",le="0.1"} 1' in lines
+    assert 'latency_seconds_count{status="error"} 1' in lines
+
+def test_github_connection_error_keeps_metrics_scrapable(github, monkeypatch):
+    from metrics import registry
+    monkeypatch.setattr(github, 'base_url', 'http://127.0.0.1:9')
+    github.max_retries = 0
+    assert github.get_file_content('x.csv') == (None, None)
+    assert 'github_requests_total{method="GET",status="error"}' in registry.render()
+
+def test_counter_function_is_typed_as_counter():
+    from metrics import CounterFunction
+    metric = CounterFunction('hits_total', 'hits', lambda: 3)
+    assert metric.render() == ['# HELP hits_total hits', '# TYPE hits_total counter', 'hits_total 3']
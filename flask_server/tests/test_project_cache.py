@@ -0,0 +1,79 @@
+import threading
+import time
+
+from project_cache import ProjectCache
+
+
+class SlowGitHub:
+    """get_file_if_modified가 release될 때까지 멈춰 있는 GitHubService 대역"""
+
+    def __init__(self):
+        self.content = 'v1'
+        self.calls = 0
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.release.set()
+
+    def get_file_if_modified(self, path, etag=None):
+        # 요청 시점의 내용을 응답
+        content = self.content
+        self.calls += 1
+        self.started.set()
+        self.release.wait(5)
+        sha = f'sha-{content}'
+        if etag == sha:
+            return True, None, sha, etag
+        return False, content, sha, sha
+
+
+def start_refresh(cache, github):
+    github.started.clear()
+    github.release.clear()
+    thread = threading.Thread(target=cache.get)
+    thread.start()
+    assert github.started.wait(5)
+    return thread
+
+
+def test_reads_get_stale_value_while_revalidation_is_slow():
+    github = SlowGitHub()
+    cache = ProjectCache(github, 'x.csv', str.upper, ttl=0)
+    assert cache.get() == ('V1', 'sha-v1')
+
+    github.content = 'v2'
+    refresh = start_refresh(cache, github)
+    started = time.monotonic()
+    assert cache.get() == ('V1', 'sha-v1')
+    assert time.monotonic() - started < 1
+    assert github.calls == 2
+
+    github.release.set()
+    refresh.join()
+    assert cache.get() == ('V2', 'sha-v2')
+
+def test_fresh_read_waits_and_skips_results_from_before_invalidate():
+    github = SlowGitHub()
+    cache = ProjectCache(github, 'x.csv', str.upper, ttl=60)
+    cache.get()
+
+    cache.invalidate()
+    refresh = start_refresh(cache, github)
+    # 재검증이 진행 중일 때 쓰기가 끝남
+    github.content = 'v2'
+    cache.invalidate()
+    github.release.set()
+    assert cache.get(fresh=True) == ('V2', 'sha-v2')
+    refresh.join()
+
+def test_first_load_waits_for_the_in_flight_request():
+    github = SlowGitHub()
+    cache = ProjectCache(github, 'x.csv', str.upper, ttl=60)
+    refresh = start_refresh(cache, github)
+    results = []
+    reader = threading.Thread(target=lambda: results.append(cache.get()))
+    reader.start()
+    github.release.set()
+    reader.join()
+    refresh.join()
+    assert results == [('V1', 'sha-v1')]
+    assert github.calls == 1
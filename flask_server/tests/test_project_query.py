@@ -0,0 +1,14 @@
+import pytest
+
+from project_query import ProjectIndex, ProjectQuery
+
+
+def test_fields_projects_known_columns():
+    index = ProjectIndex(1, [{'id': 'p1', 'name': 'a', 'status': '진행중'}])
+    results, _ = index.search(ProjectQuery({'fields': 'id,name'}))
+    assert results == [{'id': 'p1', 'name': 'a'}]
+
+@pytest.mark.parametrize('args', [{'fields': 'id,nmae'}, {'sort': 'nmae'}])
+def test_unknown_columns_are_rejected(args):
+    with pytest.raises(ValueError):
+        ProjectQuery(args)
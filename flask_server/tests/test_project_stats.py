@@ -0,0 +1,30 @@
+from datetime import date
+
+from project_stats import ProjectStats
+
+
+def test_overdue_skips_closed_statuses():
+    stats = ProjectStats()
+    stats.reset([
+        {'id': 'p1', 'status': '진행중', 'manager': 'kim', 'end_date': '2025-01-10'},
+        {'id': 'p2', 'status': '완료', 'manager': 'kim', 'end_date': '2025-01-10'},
+        {'id': 'p3', 'status': '보류', 'manager': 'lee', 'end_date': '2025-01-10'},
+    ])
+    overdue = stats.summary(today=date(2025, 2, 1))['overdue']
+    assert overdue == {'total': 1, 'by_manager': {'kim': 1}}
+
+def test_incremental_updates_match_a_fresh_count():
+    projects = [{'id': f'p{i}', 'status': '진행중', 'manager': f'm{i % 3}',
+                 'category': 'c', 'end_date': f'2025-01-{i + 1:02d}'} for i in range(10)]
+    stats = ProjectStats()
+    stats.reset(projects)
+    stats.apply(projects[0], dict(projects[0], status='보류'))
+    stats.apply(projects[1], None)
+    stats.apply(None, {'id': 'p10', 'status': '대기', 'manager': 'm0', 'end_date': '2025-03-01'})
+
+    current = [dict(projects[0], status='보류')] + projects[2:] + [
+        {'id': 'p10', 'status': '대기', 'manager': 'm0', 'end_date': '2025-03-01'}]
+    fresh = ProjectStats()
+    fresh.reset(current)
+    today = date(2025, 2, 1)
+    assert stats.summary('week', today) == fresh.summary('week', today)
@@ -0,0 +1,116 @@
+import threading
+import time
+
+from commit_queue import ProjectOperation
+from conftest import CSV_PATH
+from project_records import ProjectTable
+
+
+def stored_ids(fake):
+    return [record.id for record in ProjectTable.parse(fake.read_file(CSV_PATH)).records()]
+
+
+def test_add_with_existing_id_is_duplicate(fake, store):
+    pending = store.submit(ProjectOperation('add', project={'id': 'p1', 'name': 'again'}))
+    assert pending.wait(5)
+    assert (pending.status, pending.error) == ('failed', 'duplicate')
+    assert stored_ids(fake) == ['p0', 'p1', 'p2']
+
+def test_import_with_existing_id_adds_nothing(fake, store):
+    projects = [{'id': 'p9', 'name': 'new'}, {'id': 'p2', 'name': 'again'}]
+    pending = store.submit(ProjectOperation('import', projects=projects))
+    assert pending.wait(5)
+    assert pending.error == 'duplicate'
+    assert stored_ids(fake) == ['p0', 'p1', 'p2']
+
+def test_duplicate_does_not_fail_the_rest_of_the_batch(fake, store):
+    first = store.submit(ProjectOperation('add', project={'id': 'p9', 'name': 'new'}))
+    second = store.submit(ProjectOperation('add', project={'id': 'p9', 'name': 'again'}))
+    assert first.wait(5) and second.wait(5)
+    assert first.status == 'committed'
+    assert second.error == 'duplicate'
+    assert stored_ids(fake) == ['p0', 'p1', 'p2', 'p9']
+
+def test_conflict_reapplies_on_latest_content(fake, store):
+    store.snapshot()
+    # 캐시가 모르는 사이 다른 곳에서 파일이 바뀜
+    content = fake.read_file(CSV_PATH)
+    fake.put_file(CSV_PATH, content.replace('name-1', 'renamed'))
+
+    pending = store.submit(ProjectOperation('add', project={'id': 'p9', 'name': 'new'}))
+    assert pending.wait(5)
+    assert pending.status == 'committed'
+    table = ProjectTable.parse(fake.read_file(CSV_PATH))
+    assert [record.id for record in table.records()] == ['p0', 'p1', 'p2', 'p9']
+    assert table.get('p1').name == 'renamed'
+
+def test_read_between_commit_and_on_commit_does_not_double_count(fake, github, store):
+    from change_log import ChangeLog
+    from project_stats import ProjectStats
+
+    stats, change_log = ProjectStats(), ChangeLog()
+    store.add_observer(stats)
+    store.add_observer(change_log)
+    store.snapshot()
+    cursor = change_log.cursor()
+
+    readers = []
+    commit_file = github.commit_file
+
+    def commit_then_read(*args):
+        # 커밋 직후 on_commit보다 먼저 다른 요청이 새 SHA를 읽는 경우
+        result = commit_file(*args)
+        store.cache.invalidate()
+        reader = threading.Thread(target=store.snapshot)
+        reader.start()
+        reader.join(0.3)
+        readers.append(reader)
+        return result
+
+    github.commit_file = commit_then_read
+    pending = store.submit(ProjectOperation('add', project={'id': 'p9', 'name': 'new'}))
+    assert pending.wait(5) and pending.status == 'committed'
+    readers[0].join(5)
+
+    assert stats.total == len(ProjectTable.parse(fake.read_file(CSV_PATH))) == 4
+    upserts, deletes, _ = change_log.changes_since(cursor)
+    assert [project['id'] for project in upserts] == ['p9']
+
+def test_own_commit_is_cached_without_refetch(fake, store):
+    store.snapshot()
+    pending = store.submit(ProjectOperation('add', project={'id': 'p9', 'name': 'new'}))
+    assert pending.wait(5) and pending.status == 'committed'
+    requests_after_commit = fake.requests
+    assert [p['id'] for p in store.snapshot()[1]] == ['p0', 'p1', 'p2', 'p9']
+    assert fake.requests == requests_after_commit
+
+def test_reads_after_own_commit_do_not_roll_observers_back(fake, store):
+    from change_log import ChangeLog
+    from project_stats import ProjectStats
+
+    stats, change_log = ProjectStats(), ChangeLog()
+    store.add_observer(stats)
+    store.add_observer(change_log)
+    store.snapshot()
+    before_commit = store.cache.get()
+    cursor = change_log.cursor()
+
+    pending = store.submit(ProjectOperation('add', project={'id': 'p9', 'name': 'new'}))
+    assert pending.wait(5) and pending.status == 'committed'
+    # 커밋 직후 한 스레드가 느리게 재검증하는 동안 다른 읽기가 들어옴
+    store.cache.ttl = 0
+    fake.latency = 0.3
+    refresh = threading.Thread(target=store.snapshot)
+    refresh.start()
+    time.sleep(0.1)
+    store.snapshot()
+    # 커밋 전에 캐시에서 꺼낸 값이 늦게 도착한 경우
+    store._sync(*before_commit)
+    assert stats.total == 4
+    refresh.join()
+    assert stats.total == 4
+
+    # 쓰기 직전에 받은 커서는 여전히 변경분만 받음
+    upserts, deletes, next_cursor = change_log.changes_since(cursor)
+    assert ([project['id'] for project in upserts], deletes) == (['p9'], [])
+    assert next_cursor == f"{store.cache.sha[:12]}.0"
@@ -0,0 +1,43 @@
+from commit_queue import ProjectOperation
+from models import Project, db
+from sql_store import SQLProjectStore
+from project_stats import ProjectStats
+
+
+def test_snapshot_version_changes_only_with_data(sql_app):
+    store = SQLProjectStore(ttl=0)
+    stats = ProjectStats()
+    store.add_observer(stats)
+    store.submit(ProjectOperation('add', project={'id': 'p1', 'name': 'a'}))
+    version, _ = store.snapshot()
+    assert store.snapshot()[0] == version
+
+    # 다른 워커의 쓰기
+    db.session.add(Project(id='p2', name='b'))
+    db.session.commit()
+    changed, projects = store.snapshot()
+    assert changed != version
+    assert sorted(p['id'] for p in projects) == ['p1', 'p2']
+    assert stats.total == 2
+    assert store.snapshot()[0] == changed
+
+    # 자체 쓰기
+    store.submit(ProjectOperation('update', project_id='p1', project={'name': 'c'}))
+    assert store.snapshot()[0] != changed
+
+def test_import_does_not_reload_each_row(sql_app):
+    from sqlalchemy import event
+
+    store = SQLProjectStore(ttl=60)
+    store.snapshot()
+    statements = []
+    event.listen(db.engine, 'before_cursor_execute',
+                 lambda conn, cursor, statement, *args: statements.append(statement))
+    projects = [{'id': f'p{i}', 'name': f'n{i}', 'status': '진행중'} for i in range(50)]
+    operation = ProjectOperation('import', projects=projects)
+    assert store.submit(operation).status == 'committed'
+
+    assert not any(statement.lstrip().upper().startswith('SELECT') for statement in statements)
+    assert operation.changes[0] == (None, dict(
+        {field: '' for field in Project.__table__.columns.keys()},
+        id='p0', name='n0', status='진행중'))